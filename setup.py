@@ -28,7 +28,7 @@ setup(
         "anthropic",
         "mistralai",
         "numpy",
-        "pandas",
+        "pandas>=2.0",
         "matplotlib",
         "seaborn",
         "pyyaml",
@@ -44,12 +44,16 @@ setup(
             "flask>=2.0.0",
             "jinja2",
             "scipy",
+            "orjson",
         ],
         "all": [
             "plotly>=5.0.0", 
             "flask>=2.0.0",
             "jinja2",
             "scipy",
+            "orjson",
+            "pyarrow",
+            "waitress",
         ]
     },
     entry_points={
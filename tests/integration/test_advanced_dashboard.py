@@ -188,7 +188,23 @@ class TestAdvancedDashboardIntegration:
         rankings = analyzer.model_ranking()
         assert len(rankings) == 3
         assert all('model' in r and 'composite_score' in r for r in rankings)
-        
+
+        # Test z-score outlier detection: one low run among ten, and a constant series (std == 0)
+        outlier_results = {
+            "spiky": {"runs": [
+                {"scenario": {"name": f"scenario_{i}"}, "overall_score": 1.0 if i == 9 else 7.0}
+                for i in range(10)
+            ]},
+            "constant": {"runs": [
+                {"scenario": {"name": f"scenario_{i}"}, "overall_score": 7.0}
+                for i in range(10)
+            ]}
+        }
+        outliers = BenchmarkAnalyzer(outlier_results).outlier_detection(method='zscore')
+        assert [o['scenario'] for o in outliers['spiky']] == ['scenario_9']
+        assert not outliers['spiky'][0]['is_high']
+        assert outliers['constant'] == []
+
         # Test FilterManager
         filter_manager = FilterManager(results)
         
@@ -205,6 +221,69 @@ class TestAdvancedDashboardIntegration:
             for model_data in filtered.values()
         )
     
+    def test_filter_manager_filters(self):
+        """Test each FilterManager filter and their combination."""
+        try:
+            from visualization import _ADVANCED_FEATURES_AVAILABLE
+            if not _ADVANCED_FEATURES_AVAILABLE:
+                pytest.skip("Advanced features not available")
+        except ImportError:
+            pytest.skip("Cannot import visualization module")
+
+        from visualization.analysis_utils import FilterManager
+
+        results = {}
+        for json_file in self.results_dir.glob('*.json'):
+            data = json.loads(json_file.read_text())
+            results[data['model_name']] = data
+        filter_manager = FilterManager(results)
+
+        def scenario_names(filtered):
+            return {model: [run['scenario']['name'] for run in data['runs']] for model, data in filtered.items()}
+
+        # Models
+        assert set(filter_manager.filter_by_models(['gpt-4'])) == {'gpt-4'}
+
+        # Scenario substrings are case-sensitive
+        filtered = filter_manager.filter_by_scenarios(['Technical'])
+        assert scenario_names(filtered) == {model: ['Technical Support'] for model in results}
+        assert filter_manager.filter_by_scenarios(['technical']) == {}
+        assert filtered['gpt-4']['model_name'] == 'gpt-4'  # Other model fields are kept
+
+        # Score range is inclusive on the overall score
+        filtered = filter_manager.filter_by_score_range(7.25, 7.45)
+        assert scenario_names(filtered) == {
+            'claude-3-sonnet': ['Technical Support', 'Contract Negotiation'],
+            'mistral-large': ['Product Inquiry']
+        }
+
+        # Complexity
+        filtered = filter_manager.filter_by_complexity(['high'])
+        assert scenario_names(filtered) == {model: ['Contract Negotiation'] for model in results}
+
+        # Naive date bounds are read as UTC; aware bounds are converted to UTC
+        expected = {model: ['Technical Support'] for model in results}
+        assert scenario_names(filter_manager.filter_by_date_range(
+            '2025-05-22T12:30:00', '2025-05-22T13:30:00')) == expected
+        assert scenario_names(filter_manager.filter_by_date_range(
+            '2025-05-22T14:30:00+02:00', '2025-05-22T15:30:00+02:00')) == expected
+
+        # No filters returns the results themselves, not a copy
+        assert filter_manager.apply_multiple_filters({}) is results
+        assert set(filter_manager.apply_multiple_filters({'models': ['gpt-4']})) == {'gpt-4'}
+
+        # Combined filters intersect
+        filtered = filter_manager.apply_multiple_filters({
+            'models': ['gpt-4', 'claude-3-sonnet'],
+            'scenarios': ['Support', 'Inquiry'],
+            'complexities': ['medium', 'high'],
+            'date_range': {'start': '2025-05-22T00:00:00Z', 'end': '2025-05-22T23:59:59Z'}
+        })
+        assert scenario_names(filtered) == {
+            'gpt-4': ['Technical Support'],
+            'claude-3-sonnet': ['Technical Support']
+        }
+
     def test_interactive_charts_mock(self):
         """Test interactive charts with mock plotly."""
         try:
@@ -268,6 +347,88 @@ class TestAdvancedDashboardIntegration:
                 # Should show helpful error message
                 assert "pip install bizcon[advanced]" in str(e) or "Advanced dashboard features require" in str(e)
     
+    def test_api_etag_revalidation(self):
+        """Test that unchanged API responses revalidate with 304 and reloads change the ETag."""
+        try:
+            from visualization import _ADVANCED_FEATURES_AVAILABLE
+            if not _ADVANCED_FEATURES_AVAILABLE:
+                pytest.skip("Advanced features not available")
+        except ImportError:
+            pytest.skip("Cannot import visualization module")
+
+        from visualization.advanced_dashboard import AdvancedBenchmarkDashboard
+        dashboard = AdvancedBenchmarkDashboard(
+            results_dir=str(self.results_dir),
+            auto_refresh=False
+        )
+        client = dashboard.app.test_client()
+
+        # A repeated request carrying the ETag is answered with 304
+        response = client.get('/api/charts/radar')
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        assert response.headers['Cache-Control'] == 'no-cache'
+
+        response = client.get('/api/charts/radar', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
+        # A different query string is a different response
+        response = client.get('/api/charts/radar?models=gpt-4', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+        # Reloading changed data invalidates the old ETag
+        response = client.get('/api/statistics')
+        stats_etag = response.headers['ETag']
+        assert client.get('/api/statistics', headers={'If-None-Match': stats_etag}).status_code == 304
+
+        new_results = json.loads((self.results_dir / "gpt-4_results.json").read_text())
+        new_results["model_name"] = "gpt-4o"
+        (self.results_dir / "gpt-4o_results.json").write_text(json.dumps(new_results))
+        client.get('/api/refresh')
+
+        response = client.get('/api/statistics', headers={'If-None-Match': stats_etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != stats_etag
+        assert response.get_json()['total_models'] == 4
+
+    def test_bootstrap_endpoint(self):
+        """Test that /api/bootstrap returns statistics and the chart in one cacheable response."""
+        try:
+            from visualization import _ADVANCED_FEATURES_AVAILABLE
+            if not _ADVANCED_FEATURES_AVAILABLE:
+                pytest.skip("Advanced features not available")
+        except ImportError:
+            pytest.skip("Cannot import visualization module")
+
+        from visualization.advanced_dashboard import AdvancedBenchmarkDashboard
+        dashboard = AdvancedBenchmarkDashboard(
+            results_dir=str(self.results_dir),
+            auto_refresh=False
+        )
+        client = dashboard.app.test_client()
+
+        response = client.get('/api/bootstrap?chart=radar')
+        assert response.status_code == 200
+        payload = response.get_json()
+        assert payload['statistics']['total_models'] == 3
+        assert 'chart' in payload
+        assert 'chart_error' not in payload
+
+        response = client.get('/api/bootstrap?chart=radar', headers={'If-None-Match': response.headers['ETag']})
+        assert response.status_code == 304
+
+        # Filters narrow the chart but not the statistics
+        payload = client.get('/api/bootstrap?chart=radar&models=gpt-4').get_json()
+        assert payload['statistics']['total_models'] == 3
+        assert len(json.loads(payload['chart'])['data']) == 1
+
+        # An unknown chart still returns the statistics, with the chart error alongside
+        payload = client.get('/api/bootstrap?chart=unknown').get_json()
+        assert payload['statistics']['total_models'] == 3
+        assert payload['chart_error'] == 'Unknown chart type: unknown'
+
     def test_dashboard_data_loading(self):
         """Test that dashboard correctly loads and processes data."""
         try:
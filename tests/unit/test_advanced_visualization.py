@@ -212,6 +212,205 @@ class TestBenchmarkAnalyzerMock:
             pass
 
 
+class TestInteractiveChartStructure:
+    """Tests for the trace layout of the interactive Plotly charts."""
+
+    def setup_method(self):
+        """Create the chart builder, skipping without plotly."""
+        pytest.importorskip("plotly")
+        interactive_charts = pytest.importorskip("visualization.interactive_charts")
+        self.charts = interactive_charts.InteractiveCharts()
+
+    def test_3d_scatter_single_trace(self):
+        """Test that all models are drawn as one Scatter3d trace, one point per model."""
+        results = {
+            "model1": {"quality": 8.0, "value": 7.0, "style": 6.0},
+            "model2": {"quality": 6.5, "value": 9.0, "style": 7.5},
+            "model3": {"quality": 5.0, "value": 4.0, "style": 9.5}
+        }
+
+        fig = self.charts.model_comparison_3d_scatter(results)
+
+        assert len(fig.data) == 1
+        trace = fig.data[0]
+        assert trace.type == 'scatter3d'
+        assert list(trace.text) == ["model1", "model2", "model3"]
+        assert list(trace.x) == [8.0, 6.5, 5.0]
+        assert list(trace.y) == [7.0, 9.0, 4.0]
+        assert list(trace.z) == [6.0, 7.5, 9.5]
+
+
+    def test_box_plots_one_trace_per_model(self):
+        """Test that each model is one Box trace spanning all scenarios, grouped by scenario."""
+        scenario_results = {
+            "scenario1": [{"model1": 7.0, "model2": 6.0}, {"model1": 8.0, "model2": 5.0}],
+            "scenario2": [{"model1": 6.0, "model2": 9.0}]
+        }
+
+        fig = self.charts.interactive_box_plots(scenario_results)
+
+        assert [trace.type for trace in fig.data] == ['box', 'box']
+        assert [trace.name for trace in fig.data] == ["model1", "model2"]
+        assert fig.layout.boxmode == 'group'
+        assert list(fig.data[0].x) == ["scenario1", "scenario1", "scenario2"]
+        assert list(fig.data[0].y) == [7.0, 8.0, 6.0]
+        assert list(fig.data[1].y) == [6.0, 5.0, 9.0]
+
+    def test_timeline_restyle_slider(self):
+        """Test that the timeline keeps one trace per model and its slider restyles them in trace order."""
+        turn_scores = {
+            "model1": [{"overall_score": 6.0}, {"overall_score": 7.0}, {"overall_score": 8.0}],
+            "model2": [{"overall_score": 5.0}, {"overall_score": 9.0}]
+        }
+
+        fig = self.charts.animated_performance_timeline(turn_scores)
+
+        assert [trace.name for trace in fig.data] == ["model1", "model2"]
+        assert not fig.frames
+        steps = fig.layout.sliders[0].steps
+        assert [step.label for step in steps] == ['All', '1', '2', '3']
+
+        for step in steps:
+            assert step.method == 'restyle'
+            # A single update dict and no trace indices: entry i of each array restyles trace i
+            assert len(step.args) == 1
+            update = step.args[0]
+            assert len(update['x']) == len(update['y']) == len(update['customdata']) == len(fig.data)
+
+        # 'All' restores every trace's full timeline
+        all_update = steps[0].args[0]
+        assert all_update['x'] == [list(trace.x) for trace in fig.data]
+        assert all_update['y'] == [list(trace.y) for trace in fig.data]
+
+        # Each turn step keeps only that turn's point, or nothing for models with fewer turns
+        for turn, step in enumerate(steps[1:], start=1):
+            update = step.args[0]
+            for trace, x, y in zip(fig.data, update['x'], update['y']):
+                expected = [(tx, ty) for tx, ty in zip(trace.x, trace.y) if tx == turn]
+                assert list(zip(x, y)) == expected
+        assert steps[3].args[0]['x'] == [[3], []]
+
+    def test_parallel_coordinates_score_buckets(self):
+        """Test that lines are coloured by average score bucket, with a perfect 10 in the top bucket."""
+        results = {
+            "model1": {"quality": 10.0, "value": 10.0},
+            "model2": {"quality": 4.5, "value": 5.0},
+            "model3": {"quality": 0.0, "value": 0.5}
+        }
+
+        fig = self.charts.parallel_coordinates_comparison(results)
+
+        line = fig.data[0].line
+        assert list(line.color) == [9, 4, 0]
+        assert (line.cmin, line.cmax) == (0, 9)
+        assert line.colorbar.title.text == "Avg Score bucket"
+        assert list(line.colorbar.ticktext)[-1] == "9–10"
+
+class TestLttbDownsampling:
+    """Tests for the LTTB downsampler used by performance trends."""
+
+    def setup_method(self):
+        """Import the downsampler, skipping without the analysis dependencies."""
+        analysis_utils = pytest.importorskip("visualization.analysis_utils")
+        self.np = pytest.importorskip("numpy")
+        self.lttb_indices = analysis_utils._lttb_indices
+
+    def test_downsampled_shape(self):
+        """Test that endpoints are kept and n_out strictly increasing indices are returned."""
+        x = self.np.arange(1000, dtype=float)
+        y = self.np.sin(x / 25.0)
+
+        indices = self.lttb_indices(x, y, 50)
+
+        assert len(indices) == 50
+        assert indices[0] == 0
+        assert indices[-1] == 999
+        assert (self.np.diff(indices) > 0).all()
+
+    def test_single_spike_is_kept(self):
+        """Test that a lone spike survives downsampling."""
+        x = self.np.arange(500, dtype=float)
+        y = self.np.zeros(500)
+        y[237] = 10.0
+
+        indices = self.lttb_indices(x, y, 20)
+
+        assert 237 in indices
+
+    def test_short_input_passes_through(self):
+        """Test that inputs no longer than n_out, or n_out below 3, are returned whole."""
+        x = self.np.arange(10, dtype=float)
+        y = x ** 2
+
+        assert list(self.lttb_indices(x, y, 10)) == list(range(10))
+        assert list(self.lttb_indices(x, y, 50)) == list(range(10))
+        assert list(self.lttb_indices(x, y, 2)) == list(range(10))
+
+
+class TestReportGenerateAll:
+    """Tests for BenchmarkReport.generate_all."""
+
+    def setup_method(self):
+        """Create a small results set and an output directory."""
+        report_module = pytest.importorskip("visualization.report")
+        self.BenchmarkReport = report_module.BenchmarkReport
+        self.temp_dir = tempfile.TemporaryDirectory()
+        categories = ["response_quality", "business_value", "communication_style", "tool_usage"]
+        self.results = {
+            model: {
+                "overall": {
+                    "score": 6.0 + index,
+                    "evaluator_scores": {"response_quality": 7.0, "business_value": 6.5},
+                    "tool_usage": {"tool_selection": 7.0, "parameter_quality": 6.0},
+                    "category_scores": {category: 5.0 + index for category in categories},
+                    "success_rates": {"response_quality": 0.8, "business_value": 0.7}
+                },
+                "runs": [
+                    {
+                        "scenario": {"name": scenario},
+                        "overall_score": 6.0 + index,
+                        "turns": [{"score": 6.0}, {"score": 7.0}]
+                    }
+                    for scenario in ["product_inquiry", "technical_support"]
+                ]
+            }
+            for index, model in enumerate(["model1", "model2"])
+        }
+
+    def teardown_method(self):
+        """Clean up the output directory."""
+        self.temp_dir.cleanup()
+
+    def test_default_formats_without_wkhtmltopdf(self):
+        """Test that every default format produces a file, PDF falling back to HTML."""
+        report = self.BenchmarkReport(self.results, self.temp_dir.name)
+
+        try:
+            import pdfkit
+            no_wkhtmltopdf = patch.object(pdfkit, 'from_string', side_effect=OSError("No wkhtmltopdf executable found"))
+        except ImportError:
+            no_wkhtmltopdf = patch.dict('sys.modules', {'pdfkit': None})
+        with no_wkhtmltopdf:
+            paths = report.generate_all()
+
+        assert set(paths) == {'html', 'pdf', 'markdown'}
+        assert paths['pdf'] == paths['html']
+        assert paths['html'].endswith('.html')
+        assert paths['markdown'].endswith('.md')
+        assert all(Path(path).is_file() for path in paths.values())
+
+    def test_format_validation(self):
+        """Test that no formats is a no-op and unknown formats are rejected."""
+        report = self.BenchmarkReport(self.results, self.temp_dir.name)
+
+        assert report.generate_all(()) == {}
+        assert list(Path(self.temp_dir.name).iterdir()) == []
+
+        with pytest.raises(ValueError) as exc_info:
+            report.generate_all(('html', 'docx'))
+        assert "docx" in str(exc_info.value)
+
+
 class TestDashboardIntegration:
     """Integration tests for dashboard functionality."""
     
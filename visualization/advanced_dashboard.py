@@ -4,6 +4,8 @@ Advanced interactive dashboard with real-time updates, filtering, and comparison
 from typing import Dict, List, Any, Optional, Union
 import json
 import os
+import hashlib
+import re
 import datetime
 import tempfile
 from pathlib import Path
@@ -15,7 +17,7 @@ import plotly
 import plotly.graph_objects as go
 from plotly.utils import PlotlyJSONEncoder
 
-from .interactive_charts import InteractiveCharts
+from .interactive_charts import InteractiveCharts, figure_to_json
 from .charts import set_plotting_style
 
 
@@ -87,6 +89,9 @@ class AdvancedBenchmarkDashboard:
         def interactive_charts(chart_type):
             """API endpoint for interactive Plotly charts."""
             results = self._load_results()
+            etag = self._etag(results)
+            if self._etag_matches(etag):
+                return '', 304
             
             # Apply filters if provided
             models = request.args.getlist('models')
@@ -95,46 +100,33 @@ class AdvancedBenchmarkDashboard:
                 results = self._filter_results(results, models, scenarios)
             
             try:
-                if chart_type == 'radar':
-                    evaluator_scores = self._extract_evaluator_scores(results)
-                    fig = self.chart_generator.interactive_radar_chart(evaluator_scores)
-                
-                elif chart_type == '3d_scatter':
-                    evaluator_scores = self._extract_evaluator_scores(results)
-                    dimensions = request.args.getlist('dimensions')
-                    fig = self.chart_generator.model_comparison_3d_scatter(evaluator_scores, dimensions)
-                
-                elif chart_type == 'heatmap':
-                    scenario_scores = self._extract_scenario_scores(results)
-                    fig = self.chart_generator.interactive_heatmap_with_dendogram(scenario_scores)
-                
-                elif chart_type == 'parallel':
-                    evaluator_scores = self._extract_evaluator_scores(results)
-                    fig = self.chart_generator.parallel_coordinates_comparison(evaluator_scores)
-                
-                elif chart_type == 'sunburst':
-                    evaluator_scores = self._extract_evaluator_scores(results)
-                    fig = self.chart_generator.sunburst_performance_breakdown(evaluator_scores)
-                
-                elif chart_type == 'timeline':
-                    turn_scores = self._extract_turn_scores(results)
-                    metric = request.args.get('metric', 'overall_score')
-                    fig = self.chart_generator.animated_performance_timeline(turn_scores, metric)
-                
-                elif chart_type == 'boxplot':
-                    scenario_results = self._extract_scenario_results(results)
-                    fig = self.chart_generator.interactive_box_plots(scenario_results)
-                
-                else:
+                fig = self._build_chart(chart_type, results, request.args)
+                if fig is None:
                     return jsonify({'error': f'Unknown chart type: {chart_type}'}), 400
                 
                 # Convert to JSON for frontend
-                chart_json = json.dumps(fig, cls=PlotlyJSONEncoder)
-                return jsonify({'chart': chart_json})
+                chart_json = figure_to_json(fig)
+                return self._tag_response(jsonify({'chart': chart_json}), etag)
                 
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
+        @app.route('/api/bootstrap')
+        def bootstrap():
+            """API endpoint returning statistics and the initial chart in one response."""
+            chart_type = request.args.get('chart', 'radar')
+            results = self._load_results()
+            etag = self._etag(results)
+            if self._etag_matches(etag):
+                return '', 304
+            
+            # The chart honours the same filters as /api/charts; statistics cover all results
+            models = request.args.getlist('models')
+            scenarios = request.args.getlist('scenarios')
+            chart_results = self._filter_results(results, models, scenarios) if models or scenarios else results
+            payload = self._dashboard_payload(results, chart_type, request.args, chart_results)
+            return self._tag_response(jsonify(payload), etag)
+        
         @app.route('/api/comparison')
         def model_comparison():
             """API endpoint for detailed model comparison."""
@@ -153,8 +145,11 @@ class AdvancedBenchmarkDashboard:
         def statistics():
             """API endpoint for dashboard statistics."""
             results = self._load_results()
+            etag = self._etag(results)
+            if self._etag_matches(etag):
+                return '', 304
             stats = self._calculate_statistics(results)
-            return jsonify(stats)
+            return self._tag_response(jsonify(stats), etag)
         
         @app.route('/api/export/<format>')
         def export_data(format):
@@ -181,11 +176,21 @@ class AdvancedBenchmarkDashboard:
             """API endpoint for manual data refresh."""
             self._clear_cache()
             results = self._load_results()
-            return jsonify({
+            payload = {
                 'status': 'refreshed',
                 'timestamp': self._last_update,
                 'models_count': len(results)
-            })
+            }
+            
+            # Include everything the page redraws so a refresh is a single round trip
+            chart_type = request.args.get('chart')
+            if chart_type:
+                models = request.args.getlist('models')
+                scenarios = request.args.getlist('scenarios')
+                chart_results = self._filter_results(results, models, scenarios) if models or scenarios else results
+                payload.update(self._dashboard_payload(results, chart_type, request.args, chart_results))
+            
+            return jsonify(payload)
         
         # Create template files
         self._create_template_files()
@@ -229,6 +234,75 @@ class AdvancedBenchmarkDashboard:
         
         return results
     
+    def _etag(self, results: Dict[str, Any]) -> str:
+        """ETag for the current request: loaded-data version plus path and query string."""
+        version = f"{self._last_update.timestamp() if self._last_update else 0}-{len(results)}"
+        request_key = hashlib.md5(request.full_path.encode('utf-8')).hexdigest()[:8]
+        return f'"{version}-{request_key}"'
+    
+    def _etag_matches(self, etag: str) -> bool:
+        """Whether the client already holds the response identified by etag."""
+        return request.headers.get('If-None-Match') == etag
+    
+    def _tag_response(self, response, etag: str):
+        """Attach the ETag and require revalidation so unchanged data returns 304."""
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    
+    def _build_chart(self, chart_type: str, results: Dict[str, Any], args) -> Optional[go.Figure]:
+        """Build the Plotly figure for a chart type, or None if the type is unknown."""
+        if chart_type == 'radar':
+            evaluator_scores = self._extract_evaluator_scores(results)
+            return self.chart_generator.interactive_radar_chart(evaluator_scores)
+        
+        elif chart_type == '3d_scatter':
+            evaluator_scores = self._extract_evaluator_scores(results)
+            dimensions = args.getlist('dimensions')
+            return self.chart_generator.model_comparison_3d_scatter(evaluator_scores, dimensions)
+        
+        elif chart_type == 'heatmap':
+            scenario_scores = self._extract_scenario_scores(results)
+            return self.chart_generator.interactive_heatmap_with_dendogram(scenario_scores)
+        
+        elif chart_type == 'parallel':
+            evaluator_scores = self._extract_evaluator_scores(results)
+            return self.chart_generator.parallel_coordinates_comparison(evaluator_scores)
+        
+        elif chart_type == 'sunburst':
+            evaluator_scores = self._extract_evaluator_scores(results)
+            return self.chart_generator.sunburst_performance_breakdown(evaluator_scores)
+        
+        elif chart_type == 'timeline':
+            turn_scores = self._extract_turn_scores(results)
+            metric = args.get('metric', 'overall_score')
+            return self.chart_generator.animated_performance_timeline(turn_scores, metric)
+        
+        elif chart_type == 'boxplot':
+            scenario_results = self._extract_scenario_results(results)
+            return self.chart_generator.interactive_box_plots(scenario_results)
+        
+        return None
+    
+    def _dashboard_payload(self,
+                           results: Dict[str, Any],
+                           chart_type: str,
+                           args,
+                           chart_results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Assemble statistics plus one chart so the page can render from a single request."""
+        payload = {'statistics': self._calculate_statistics(results)}
+        
+        try:
+            fig = self._build_chart(chart_type, results if chart_results is None else chart_results, args)
+            if fig is None:
+                payload['chart_error'] = f'Unknown chart type: {chart_type}'
+            else:
+                payload['chart'] = figure_to_json(fig)
+        except Exception as e:
+            payload['chart_error'] = str(e)
+        
+        return payload
+    
     def _filter_results(self, 
                        results: Dict[str, Any], 
                        models: List[str] = None,
@@ -237,6 +311,7 @@ class AdvancedBenchmarkDashboard:
                        date_to: str = None) -> Dict[str, Any]:
         """Filter results based on criteria."""
         filtered = {}
+        scenario_pattern = re.compile('|'.join(map(re.escape, scenarios))) if scenarios else None
         
         for model_name, model_data in results.items():
             # Filter by models
@@ -254,17 +329,15 @@ class AdvancedBenchmarkDashboard:
                         continue
             
             # Filter by scenarios
-            if scenarios:
+            if scenario_pattern:
                 filtered_runs = []
                 for run in model_data.get('runs', []):
                     scenario_name = run.get('scenario', {}).get('name', '')
-                    if any(scenario in scenario_name for scenario in scenarios):
+                    if scenario_pattern.search(scenario_name):
                         filtered_runs.append(run)
                 
                 if filtered_runs:
-                    model_data_copy = model_data.copy()
-                    model_data_copy['runs'] = filtered_runs
-                    filtered[model_name] = model_data_copy
+                    filtered[model_name] = {**model_data, 'runs': filtered_runs}
             else:
                 filtered[model_name] = model_data
         
@@ -584,7 +657,7 @@ class AdvancedBenchmarkDashboard:
                                 </div>
                                 <div class="col-md-2">
                                     <label>&nbsp;</label>
-                                    <button class="btn btn-primary w-100" onclick="applyFilters()">Apply Filters</button>
+                                    <button class="btn btn-primary w-100" onclick="debouncedApplyFilters()">Apply Filters</button>
                                 </div>
                             </div>
                         </div>
@@ -632,26 +705,35 @@ class AdvancedBenchmarkDashboard:
 
             <script>
                 let currentFilters = {};
+                let chartInitialized = false;
                 let statisticsData = {};
 
-                // Initialize dashboard
+                // Initialize dashboard from a single batched request
                 document.addEventListener('DOMContentLoaded', function() {
-                    loadStatistics();
-                    loadChart('radar');
+                    const chartType = document.getElementById('chart-type').value;
+                    fetch(`/api/bootstrap?chart=${chartType}`)
+                        .then(response => response.json())
+                        .then(data => {
+                            applyStatistics(data.statistics);
+                            renderChart(data);
+                        })
+                        .catch(error => console.error('Error loading dashboard:', error));
                     setupAutoRefresh();
                 });
 
                 function loadStatistics() {
                     fetch('/api/statistics')
                         .then(response => response.json())
-                        .then(data => {
-                            statisticsData = data;
-                            updateStatistics(data);
-                            populateFilters(data);
-                        })
+                        .then(data => applyStatistics(data))
                         .catch(error => console.error('Error loading statistics:', error));
                 }
 
+                function applyStatistics(data) {
+                    statisticsData = data;
+                    updateStatistics(data);
+                    populateFilters(data);
+                }
+
                 function updateStatistics(data) {
                     document.getElementById('total-models').textContent = data.total_models || 0;
                     document.getElementById('total-scenarios').textContent = data.total_scenarios || 0;
@@ -690,40 +772,66 @@ class AdvancedBenchmarkDashboard:
                 }
 
                 function loadChart(chartType) {
-                    const chartDiv = document.getElementById('main-chart');
-                    chartDiv.innerHTML = '<i class="fas fa-spinner fa-spin fa-2x"></i><p>Loading chart...</p>';
+                    // Keep the current plot on screen while an update loads; Plotly.react swaps it in place
+                    if (!chartInitialized) {
+                        showChartMessage('<i class="fas fa-spinner fa-spin fa-2x"></i><p>Loading chart...</p>');
+                    }
 
                     let url = `/api/charts/${chartType}`;
                     
                     // Add filters to URL
-                    const params = new URLSearchParams();
-                    if (currentFilters.models && currentFilters.models.length > 0) {
-                        currentFilters.models.forEach(model => params.append('models', model));
-                    }
-                    if (currentFilters.scenarios && currentFilters.scenarios.length > 0) {
-                        currentFilters.scenarios.forEach(scenario => params.append('scenarios', scenario));
-                    }
-                    
+                    const params = filterParams();
                     if (params.toString()) {
                         url += '?' + params.toString();
                     }
 
                     fetch(url)
                         .then(response => response.json())
-                        .then(data => {
-                            if (data.error) {
-                                chartDiv.innerHTML = `<div class="alert alert-danger">Error: ${data.error}</div>`;
-                            } else {
-                                const chartData = JSON.parse(data.chart);
-                                Plotly.newPlot('main-chart', chartData.data, chartData.layout, {responsive: true});
-                            }
-                        })
+                        .then(data => renderChart(data))
                         .catch(error => {
                             console.error('Error loading chart:', error);
-                            chartDiv.innerHTML = '<div class="alert alert-danger">Failed to load chart</div>';
+                            showChartMessage('<div class="alert alert-danger">Failed to load chart</div>');
                         });
                 }
 
+                function filterParams() {
+                    const params = new URLSearchParams();
+                    if (currentFilters.models && currentFilters.models.length > 0) {
+                        currentFilters.models.forEach(model => params.append('models', model));
+                    }
+                    if (currentFilters.scenarios && currentFilters.scenarios.length > 0) {
+                        currentFilters.scenarios.forEach(scenario => params.append('scenarios', scenario));
+                    }
+                    return params;
+                }
+
+                function renderChart(data) {
+                    const error = data.error || data.chart_error;
+                    if (error) {
+                        showChartMessage(`<div class="alert alert-danger">Error: ${error}</div>`);
+                        return;
+                    }
+
+                    const chartData = JSON.parse(data.chart);
+                    if (chartInitialized) {
+                        // Diff against the existing plot instead of rebuilding it
+                        Plotly.react('main-chart', chartData.data, chartData.layout, {responsive: true});
+                    } else {
+                        document.getElementById('main-chart').innerHTML = '';
+                        Plotly.newPlot('main-chart', chartData.data, chartData.layout, {responsive: true});
+                        chartInitialized = true;
+                    }
+                }
+
+                function showChartMessage(html) {
+                    const chartDiv = document.getElementById('main-chart');
+                    if (chartInitialized) {
+                        Plotly.purge(chartDiv);
+                        chartInitialized = false;
+                    }
+                    chartDiv.innerHTML = html;
+                }
+
                 function applyFilters() {
                     const modelFilter = document.getElementById('model-filter');
                     const scenarioFilter = document.getElementById('scenario-filter');
@@ -737,6 +845,8 @@ class AdvancedBenchmarkDashboard:
                     loadChart(chartType);
                 }
 
+                const debouncedApplyFilters = debounce(applyFilters, 150);
+
                 function compareModels() {
                     const model1 = document.getElementById('compare-model1').value;
                     const model2 = document.getElementById('compare-model2').value;
@@ -789,11 +899,15 @@ class AdvancedBenchmarkDashboard:
                 function refreshData() {
                     document.getElementById('update-status').textContent = 'Refreshing...';
                     
-                    fetch('/api/refresh')
+                    // Refresh returns statistics and the current chart in one response
+                    const params = filterParams();
+                    params.set('chart', document.getElementById('chart-type').value);
+
+                    fetch(`/api/refresh?${params.toString()}`)
                         .then(response => response.json())
                         .then(data => {
-                            loadStatistics();
-                            applyFilters();
+                            applyStatistics(data.statistics);
+                            renderChart(data);
                             document.getElementById('update-status').textContent = 'Live';
                         })
                         .catch(error => {
@@ -802,16 +916,64 @@ class AdvancedBenchmarkDashboard:
                         });
                 }
 
+                let pollEtag = null;
+
+                function pollData() {
+                    // Revalidate against the last ETag; unchanged data answers 304 with no body
+                    const params = filterParams();
+                    params.set('chart', document.getElementById('chart-type').value);
+                    const query = params.toString();
+                    const headers = pollEtag && pollEtag.query === query ? {'If-None-Match': pollEtag.tag} : {};
+
+                    fetch(`/api/bootstrap?${query}`, {headers: headers, cache: 'no-store'})
+                        .then(response => {
+                            if (response.status === 304) {
+                                return null;
+                            }
+                            pollEtag = {query: query, tag: response.headers.get('ETag')};
+                            return response.json();
+                        })
+                        .then(data => {
+                            if (data) {
+                                applyStatistics(data.statistics);
+                                renderChart(data);
+                            }
+                            document.getElementById('update-status').textContent = 'Live';
+                        })
+                        .catch(error => {
+                            console.error('Error polling data:', error);
+                            document.getElementById('update-status').textContent = 'Error';
+                        });
+                }
+
                 function setupAutoRefresh() {
-                    // Auto-refresh every 30 seconds
-                    setInterval(() => {
-                        refreshData();
-                    }, 30000);
+                    // Poll every 30 seconds, paused while the tab is hidden; the
+                    // Refresh button alone forces a server-side reload
+                    let refreshTimer = document.hidden ? null : setInterval(pollData, 30000);
+
+                    document.addEventListener('visibilitychange', () => {
+                        if (document.hidden) {
+                            clearInterval(refreshTimer);
+                            refreshTimer = null;
+                        } else if (!refreshTimer) {
+                            pollData();
+                            refreshTimer = setInterval(pollData, 30000);
+                        }
+                    });
+                }
+
+                function debounce(fn, delay) {
+                    let timer;
+                    return function(...args) {
+                        clearTimeout(timer);
+                        timer = setTimeout(() => fn.apply(this, args), delay);
+                    };
                 }
 
-                // Chart type change handler
+                // Chart type change handler, debounced so rapid changes issue one request
+                const debouncedLoadChart = debounce(loadChart, 150);
                 document.getElementById('chart-type').addEventListener('change', function() {
-                    loadChart(this.value);
+                    debouncedLoadChart(this.value);
                 });
             </script>
         </body>
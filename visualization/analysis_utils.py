@@ -5,9 +5,56 @@ from typing import Dict, List, Any, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
 import json
+import re
 from pathlib import Path
 from datetime import datetime, timedelta
-import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+
+_BASE_COLUMNS = ['model', 'scenario', 'overall_score', 'timestamp', 'industry', 'complexity']
+
+
+def _results_to_dataframe(results: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Flatten benchmark results into one row per run.
+    
+    Rows follow the iteration order of ``results`` and each model's ``runs``
+    list, so row ``i`` always corresponds to the ``i``-th run encountered.
+    """
+    rows = []
+    
+    for model_name, model_data in results.items():
+        for run in model_data.get('runs', []):
+            row = {
+                'model': model_name,
+                'scenario': run.get('scenario', {}).get('name', ''),
+                'overall_score': run.get('overall_score', 0),
+                'timestamp': run.get('timestamp', ''),
+            }
+            
+            # Add evaluator scores
+            evaluator_scores = run.get('evaluator_scores', {})
+            for evaluator, score in evaluator_scores.items():
+                row[f'eval_{evaluator}'] = score
+            
+            # Add scenario metadata
+            scenario_info = run.get('scenario', {})
+            row['industry'] = scenario_info.get('industry', '')
+            row['complexity'] = scenario_info.get('complexity', '')
+            
+            rows.append(row)
+    
+    df = pd.DataFrame(rows) if rows else pd.DataFrame(columns=_BASE_COLUMNS)
+    
+    # Parse timestamps once; unparseable values become NaT
+    df['datetime'] = pd.to_datetime(df['timestamp'], errors='coerce', utc=True,
+                                    format='ISO8601', cache=True)
+    return df
 
 
 class BenchmarkAnalyzer:
@@ -17,33 +64,15 @@ class BenchmarkAnalyzer:
         """Initialize with benchmark results."""
         self.results = results
         self.df = self._convert_to_dataframe()
+        
+        # The frame is never mutated after ingest, so derived lookups can be cached
+        self._eval_cols = tuple(col for col in self.df.columns if col.startswith('eval_'))
+        self._corr = None
+        self._stats_cache = {}
     
     def _convert_to_dataframe(self) -> pd.DataFrame:
         """Convert benchmark results to pandas DataFrame for analysis."""
-        rows = []
-        
-        for model_name, model_data in self.results.items():
-            for run in model_data.get('runs', []):
-                row = {
-                    'model': model_name,
-                    'scenario': run.get('scenario', {}).get('name', ''),
-                    'overall_score': run.get('overall_score', 0),
-                    'timestamp': run.get('timestamp', ''),
-                }
-                
-                # Add evaluator scores
-                evaluator_scores = run.get('evaluator_scores', {})
-                for evaluator, score in evaluator_scores.items():
-                    row[f'eval_{evaluator}'] = score
-                
-                # Add scenario metadata
-                scenario_info = run.get('scenario', {})
-                row['industry'] = scenario_info.get('industry', '')
-                row['complexity'] = scenario_info.get('complexity', '')
-                
-                rows.append(row)
-        
-        return pd.DataFrame(rows)
+        return _results_to_dataframe(self.results)
     
     def statistical_summary(self) -> Dict[str, Any]:
         """Generate comprehensive statistical summary."""
@@ -61,18 +90,26 @@ class BenchmarkAnalyzer:
         }
         
         # Per-model statistics
-        summary['per_model'] = {}
-        for model in self.df['model'].unique():
-            model_data = self.df[self.df['model'] == model]
-            summary['per_model'][model] = {
-                'runs': len(model_data),
-                'avg_score': model_data['overall_score'].mean(),
-                'std_score': model_data['overall_score'].std(),
-                'consistency': 1 / (1 + model_data['overall_score'].std()),  # Higher = more consistent
-                'best_scenario': model_data.loc[model_data['overall_score'].idxmax(), 'scenario'],
-                'worst_scenario': model_data.loc[model_data['overall_score'].idxmin(), 'scenario'],
-                'scenario_count': model_data['scenario'].nunique()
+        stats = self._model_stats('overall_score')
+        scores_by_model = self.df.groupby('model', sort=False)['overall_score']
+        best_scenarios = self.df.loc[scores_by_model.idxmax(), 'scenario'].to_numpy()
+        worst_scenarios = self.df.loc[scores_by_model.idxmin(), 'scenario'].to_numpy()
+        
+        summary['per_model'] = {
+            model: {
+                'runs': int(runs),
+                'avg_score': avg_score,
+                'std_score': std_score,
+                'consistency': consistency,  # Higher = more consistent
+                'best_scenario': best,
+                'worst_scenario': worst,
+                'scenario_count': int(scenario_count)
             }
+            for model, runs, avg_score, std_score, consistency, best, worst, scenario_count in zip(
+                stats.index, stats['runs'], stats['mean'], stats['std'], stats['consistency'],
+                best_scenarios, worst_scenarios, stats['scenario_count']
+            )
+        }
         
         # Per-scenario statistics
         summary['per_scenario'] = {}
@@ -101,28 +138,33 @@ class BenchmarkAnalyzer:
         Returns:
             List of model rankings with details
         """
-        rankings = []
+        stats = self._model_stats(metric)
         
-        for model in self.df['model'].unique():
-            model_data = self.df[self.df['model'] == model]
-            
-            avg_score = model_data[metric].mean()
-            consistency = 1 / (1 + model_data[metric].std())
-            
-            # Composite score: average performance + consistency bonus
-            composite_score = avg_score * (1 - weight_consistency) + consistency * weight_consistency * 10
-            
-            rankings.append({
-                'model': model,
-                'avg_score': avg_score,
-                'consistency': consistency,
-                'composite_score': composite_score,
-                'runs': len(model_data),
-                'scenarios_tested': model_data['scenario'].nunique()
-            })
+        # Composite score: average performance + consistency bonus
+        composite = stats['mean'] * (1 - weight_consistency) + stats['consistency'] * weight_consistency * 10
+        
+        rankings = pd.DataFrame({
+            'model': stats.index,
+            'avg_score': stats['mean'].to_numpy(),
+            'consistency': stats['consistency'].to_numpy(),
+            'composite_score': composite.to_numpy(),
+            'runs': stats['runs'].to_numpy(),
+            'scenarios_tested': stats['scenario_count'].to_numpy()
+        }).to_dict(orient='records')
         
         return sorted(rankings, key=lambda x: x['composite_score'], reverse=True)
     
+    def _model_stats(self, metric: str) -> pd.DataFrame:
+        """Per-model mean/std/consistency of a metric from a single groupby, in first-seen model order."""
+        if metric not in self._stats_cache:
+            grouped = self.df.groupby('model', sort=False)
+            stats = grouped[metric].agg(['mean', 'std'])
+            stats['runs'] = grouped.size()
+            stats['consistency'] = 1 / (1 + stats['std'])
+            stats['scenario_count'] = grouped['scenario'].nunique()
+            self._stats_cache[metric] = stats
+        return self._stats_cache[metric]
+    
     def scenario_difficulty_analysis(self) -> Dict[str, Dict[str, float]]:
         """Analyze scenario difficulty based on average scores."""
         difficulty_analysis = {}
@@ -146,33 +188,30 @@ class BenchmarkAnalyzer:
     
     def correlation_analysis(self) -> pd.DataFrame:
         """Analyze correlations between different evaluation metrics."""
-        # Get evaluator columns
-        eval_columns = [col for col in self.df.columns if col.startswith('eval_')]
-        eval_columns.append('overall_score')
-        
-        if len(eval_columns) < 2:
+        if not self._eval_cols:
             return pd.DataFrame()
         
-        correlation_matrix = self.df[eval_columns].corr()
-        return correlation_matrix
+        if self._corr is None:
+            self._corr = self.df[list(self._eval_cols) + ['overall_score']].corr()
+        return self._corr
     
     def performance_trends(self, 
-                          time_window: str = 'day') -> Dict[str, List[Dict[str, Any]]]:
+                          time_window: str = 'day',
+                          max_points: int = 3000) -> Dict[str, List[Dict[str, Any]]]:
         """
         Analyze performance trends over time.
         
         Args:
             time_window: Aggregation window ('hour', 'day', 'week')
+            max_points: Per-model cap on returned periods; longer series are
+                downsampled with LTTB so their visual shape is preserved
             
         Returns:
             Dictionary with trends for each model
         """
-        if 'timestamp' not in self.df.columns or self.df['timestamp'].isna().all():
+        if self.df['datetime'].isna().all():
             return {}
         
-        # Convert timestamp to datetime
-        self.df['datetime'] = pd.to_datetime(self.df['timestamp'], errors='coerce')
-        
         trends = {}
         for model in self.df['model'].unique():
             model_data = self.df[self.df['model'] == model].copy()
@@ -193,6 +232,12 @@ class BenchmarkAnalyzer:
                 'overall_score': ['mean', 'std', 'count']
             }).round(3)
             
+            if len(trend_data) > max_points:
+                keep = _lttb_indices(trend_data.index.asi8.astype(float),
+                                     trend_data[('overall_score', 'mean')].to_numpy(dtype=float),
+                                     max_points)
+                trend_data = trend_data.iloc[keep]
+            
             trends[model] = [
                 {
                     'period': period.isoformat(),
@@ -223,19 +268,23 @@ class BenchmarkAnalyzer:
         for model in self.df['model'].unique():
             model_data = self.df[self.df['model'] == model]
             values = model_data[metric]
+            arr = values.to_numpy(dtype=float)
             
             if method == 'iqr':
-                Q1 = values.quantile(0.25)
-                Q3 = values.quantile(0.75)
+                Q1, Q3 = np.nanpercentile(arr, [25, 75])
                 IQR = Q3 - Q1
                 lower_bound = Q1 - 1.5 * IQR
                 upper_bound = Q3 + 1.5 * IQR
                 
-                outlier_mask = (values < lower_bound) | (values > upper_bound)
+                outlier_mask = (arr < lower_bound) | (arr > upper_bound)
                 
             elif method == 'zscore':
-                z_scores = np.abs(statistics.zscore(values))
-                outlier_mask = z_scores > 2  # 2 standard deviations
+                std = np.nanstd(arr)
+                if std > 0:
+                    z_scores = np.abs((arr - np.nanmean(arr)) / std)
+                    outlier_mask = z_scores > 2  # 2 standard deviations
+                else:
+                    outlier_mask = np.zeros(len(arr), dtype=bool)
             
             outlier_data = model_data[outlier_mask]
             
@@ -295,24 +344,19 @@ class BenchmarkAnalyzer:
             }
         }
         
-        # Scenario-by-scenario comparison
-        common_scenarios = set(data1['scenario']) & set(data2['scenario'])
-        for scenario in common_scenarios:
-            s1_scores = data1[data1['scenario'] == scenario]['overall_score']
-            s2_scores = data2[data2['scenario'] == scenario]['overall_score']
-            
-            analysis['scenario_comparison'][scenario] = {
-                model1: s1_scores.mean() if len(s1_scores) > 0 else 0,
-                model2: s2_scores.mean() if len(s2_scores) > 0 else 0,
-                'advantage': model1 if s1_scores.mean() > s2_scores.mean() else model2
-            }
+        # Scenario-by-scenario comparison (dropna keeps only common scenarios)
+        pair_data = self.df[self.df['model'].isin([model1, model2])]
+        pivot = pair_data.pivot_table(index='scenario', columns='model',
+                                      values='overall_score', aggfunc='mean').dropna()
+        pivot['advantage'] = np.where(pivot[model1] > pivot[model2], model1, model2)
+        analysis['scenario_comparison'] = pivot.to_dict(orient='index')
         
         # Evaluator comparison
-        eval_columns = [col for col in self.df.columns if col.startswith('eval_')]
-        for eval_col in eval_columns:
+        eval_means = pair_data.groupby('model')[list(self._eval_cols)].mean()
+        for eval_col in self._eval_cols:
             eval_name = eval_col.replace('eval_', '')
-            e1_scores = data1[eval_col].mean()
-            e2_scores = data2[eval_col].mean()
+            e1_scores = eval_means.at[model1, eval_col]
+            e2_scores = eval_means.at[model2, eval_col]
             
             analysis['evaluator_comparison'][eval_name] = {
                 model1: e1_scores,
@@ -357,42 +401,44 @@ class BenchmarkAnalyzer:
     
     def export_analysis(self, 
                        output_path: str,
-                       include_raw_data: bool = True) -> None:
+                       include_raw_data: bool = True,
+                       raw_data_format: str = 'csv') -> None:
         """
         Export comprehensive analysis to files.
         
         Args:
             output_path: Directory to save analysis files
             include_raw_data: Whether to include raw data export
+            raw_data_format: Raw data file format ('csv' or 'parquet')
         """
         output_dir = Path(output_path)
         output_dir.mkdir(parents=True, exist_ok=True)
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Statistical summary
-        summary = self.statistical_summary()
-        with open(output_dir / f'statistical_summary_{timestamp}.json', 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
-        
-        # Model rankings
-        rankings = self.model_ranking()
-        with open(output_dir / f'model_rankings_{timestamp}.json', 'w') as f:
-            json.dump(rankings, f, indent=2, default=str)
+        # Statistical summary, model rankings and scenario difficulty
+        json_exports = {
+            output_dir / f'statistical_summary_{timestamp}.json': self.statistical_summary(),
+            output_dir / f'model_rankings_{timestamp}.json': self.model_ranking(),
+            output_dir / f'scenario_difficulty_{timestamp}.json': self.scenario_difficulty_analysis()
+        }
         
-        # Scenario difficulty
-        difficulty = self.scenario_difficulty_analysis()
-        with open(output_dir / f'scenario_difficulty_{timestamp}.json', 'w') as f:
-            json.dump(difficulty, f, indent=2, default=str)
+        # The files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=len(json_exports)) as executor:
+            list(executor.map(_write_json, json_exports.keys(), json_exports.values()))
         
         # Correlation analysis
         correlation = self.correlation_analysis()
         if not correlation.empty:
             correlation.to_csv(output_dir / f'correlation_matrix_{timestamp}.csv')
         
-        # Raw data export
+        # Raw data export; the parsed datetime column is internal and not part of the schema
         if include_raw_data:
-            self.df.to_csv(output_dir / f'benchmark_data_{timestamp}.csv', index=False)
+            raw_data = self.df.drop(columns='datetime')
+            if raw_data_format == 'parquet':
+                raw_data.to_parquet(output_dir / f'benchmark_data_{timestamp}.parquet', index=False)
+            else:
+                raw_data.to_csv(output_dir / f'benchmark_data_{timestamp}.csv', index=False)
         
         print(f"Analysis exported to {output_dir}")
 
@@ -400,9 +446,24 @@ class BenchmarkAnalyzer:
 class FilterManager:
     """Manager for advanced filtering of benchmark results."""
     
-    def __init__(self, results: Dict[str, Any]):
-        """Initialize with benchmark results."""
+    def __init__(self, results: Dict[str, Any], df: Optional[pd.DataFrame] = None):
+        """
+        Initialize with benchmark results.
+        
+        Args:
+            results: Benchmark results keyed by model name
+            df: Pre-built run-level frame for ``results`` (e.g. ``BenchmarkAnalyzer.df``);
+                built from ``results`` when omitted
+        """
         self.results = results
+        self.df = df if df is not None else _results_to_dataframe(results)
+        
+        # Row i of self.df refers to self._run_index[i]
+        self._run_index = [
+            (model, run)
+            for model, model_data in results.items()
+            for run in model_data.get('runs', [])
+        ]
     
     def filter_by_models(self, 
                         model_names: List[str]) -> Dict[str, Any]:
@@ -415,122 +476,159 @@ class FilterManager:
     def filter_by_scenarios(self, 
                           scenario_patterns: List[str]) -> Dict[str, Any]:
         """Filter results to include only scenarios matching patterns."""
-        filtered_results = {}
-        
-        for model, model_data in self.results.items():
-            filtered_runs = []
-            for run in model_data.get('runs', []):
-                scenario_name = run.get('scenario', {}).get('name', '')
-                if any(pattern in scenario_name for pattern in scenario_patterns):
-                    filtered_runs.append(run)
-            
-            if filtered_runs:
-                model_data_copy = model_data.copy()
-                model_data_copy['runs'] = filtered_runs
-                filtered_results[model] = model_data_copy
-        
-        return filtered_results
+        return self._materialize(self._scenario_mask(scenario_patterns))
     
     def filter_by_score_range(self, 
                             min_score: float = 0,
                             max_score: float = 10,
                             metric: str = 'overall_score') -> Dict[str, Any]:
         """Filter results by score range."""
-        filtered_results = {}
-        
-        for model, model_data in self.results.items():
-            filtered_runs = []
-            for run in model_data.get('runs', []):
-                score = run.get(metric, 0)
-                if min_score <= score <= max_score:
-                    filtered_runs.append(run)
-            
-            if filtered_runs:
-                model_data_copy = model_data.copy()
-                model_data_copy['runs'] = filtered_runs
-                filtered_results[model] = model_data_copy
-        
-        return filtered_results
+        return self._materialize(self._score_mask(min_score, max_score, metric))
     
     def filter_by_date_range(self, 
                            start_date: str,
                            end_date: str) -> Dict[str, Any]:
         """Filter results by date range."""
-        start = datetime.fromisoformat(start_date)
-        end = datetime.fromisoformat(end_date)
-        
-        filtered_results = {}
-        
-        for model, model_data in self.results.items():
-            filtered_runs = []
-            for run in model_data.get('runs', []):
-                timestamp = run.get('timestamp', '')
-                if timestamp:
-                    try:
-                        run_date = datetime.fromisoformat(timestamp)
-                        if start <= run_date <= end:
-                            filtered_runs.append(run)
-                    except ValueError:
-                        continue
-            
-            if filtered_runs:
-                model_data_copy = model_data.copy()
-                model_data_copy['runs'] = filtered_runs
-                filtered_results[model] = model_data_copy
-        
-        return filtered_results
+        return self._materialize(self._date_mask(start_date, end_date))
     
     def filter_by_complexity(self, 
                            complexities: List[str]) -> Dict[str, Any]:
         """Filter results by scenario complexity levels."""
-        filtered_results = {}
-        
-        for model, model_data in self.results.items():
-            filtered_runs = []
-            for run in model_data.get('runs', []):
-                complexity = run.get('scenario', {}).get('complexity', '')
-                if complexity in complexities:
-                    filtered_runs.append(run)
-            
-            if filtered_runs:
-                model_data_copy = model_data.copy()
-                model_data_copy['runs'] = filtered_runs
-                filtered_results[model] = model_data_copy
-        
-        return filtered_results
+        return self._materialize(self._complexity_mask(complexities))
     
     def apply_multiple_filters(self, 
                              filters: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply multiple filters in sequence."""
-        results = self.results.copy()
-        
-        if 'models' in filters and filters['models']:
-            filter_manager = FilterManager(results)
-            results = filter_manager.filter_by_models(filters['models'])
+        """Apply multiple filters, combining them into a single pass over the runs."""
+        run_masks = []
         
         if 'scenarios' in filters and filters['scenarios']:
-            filter_manager = FilterManager(results)
-            results = filter_manager.filter_by_scenarios(filters['scenarios'])
+            run_masks.append(self._scenario_mask(filters['scenarios']))
         
         if 'score_range' in filters:
             range_filter = filters['score_range']
-            filter_manager = FilterManager(results)
-            results = filter_manager.filter_by_score_range(
+            run_masks.append(self._score_mask(
                 range_filter.get('min', 0),
                 range_filter.get('max', 10),
                 range_filter.get('metric', 'overall_score')
-            )
+            ))
         
         if 'date_range' in filters:
             date_filter = filters['date_range']
-            filter_manager = FilterManager(results)
-            results = filter_manager.filter_by_date_range(
-                date_filter['start'],
-                date_filter['end']
-            )
+            run_masks.append(self._date_mask(date_filter['start'], date_filter['end']))
         
         if 'complexities' in filters and filters['complexities']:
-            filter_manager = FilterManager(results)
-            results = filter_manager.filter_by_complexity(filters['complexities'])
+            run_masks.append(self._complexity_mask(filters['complexities']))
+        
+        model_names = filters.get('models')
+        if not run_masks:
+            # Model selection alone keeps whole entries, including models without runs
+            return self.filter_by_models(model_names) if model_names else self.results
         
-        return results
\ No newline at end of file
+        mask = np.logical_and.reduce(run_masks)
+        if model_names:
+            mask &= self.df['model'].isin(model_names).to_numpy()
+        
+        return self._materialize(mask)
+    
+    def _scenario_mask(self, scenario_patterns: List[str]) -> np.ndarray:
+        """Mask of runs whose scenario name contains any of the patterns."""
+        if not scenario_patterns:
+            return np.zeros(len(self.df), dtype=bool)
+        
+        pattern = _compile_patterns(scenario_patterns)
+        matching = [name for name in self.df['scenario'].unique() if pattern.search(name)]
+        return self.df['scenario'].isin(matching).to_numpy()
+    
+    def _score_mask(self, min_score: float, max_score: float, metric: str) -> np.ndarray:
+        """Mask of runs whose metric lies within [min_score, max_score]."""
+        if metric == 'overall_score':
+            scores = self.df[metric]
+        else:
+            scores = pd.Series([run.get(metric, 0) for _, run in self._run_index], dtype=float)
+        return scores.between(min_score, max_score).to_numpy()
+    
+    def _date_mask(self, start_date: str, end_date: str) -> np.ndarray:
+        """Mask of runs whose timestamp lies within [start_date, end_date]."""
+        # Unparseable timestamps are NaT and never fall inside the range
+        return self.df['datetime'].between(_to_utc(start_date), _to_utc(end_date)).to_numpy()
+    
+    def _complexity_mask(self, complexities: List[str]) -> np.ndarray:
+        """Mask of runs whose scenario complexity is one of the given levels."""
+        return self.df['complexity'].isin(complexities).to_numpy()
+    
+    def _materialize(self, mask: np.ndarray) -> Dict[str, Any]:
+        """Rebuild the results dict from the runs selected by ``mask``."""
+        filtered_runs = {}
+        for row in np.flatnonzero(mask):
+            model, run = self._run_index[row]
+            filtered_runs.setdefault(model, []).append(run)
+        
+        return {
+            model: _rewrap(self.results[model], runs)
+            for model, runs in filtered_runs.items()
+        }
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        path.write_bytes(orjson.dumps(data, default=str, option=options))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select ``n_out`` points with Largest-Triangle-Three-Buckets downsampling.
+    
+    The first and last points are always kept. The points in between are
+    split into ``n_out - 2`` buckets. Each bucket keeps the point that forms
+    the largest triangle with the previously kept point and the mean of the
+    next bucket.
+    
+    Returns:
+        Sorted positional indices into ``x``/``y``
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    every = (n - 2) / (n_out - 2)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                       - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+    
+    return selected
+
+
+def _rewrap(model_data: Dict[str, Any], runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Shallow view of a model entry with its runs replaced; run dicts are shared."""
+    return {**model_data, 'runs': runs}
+
+
+def _compile_patterns(patterns: List[str]) -> re.Pattern:
+    """Compile literal substrings into one alternation regex."""
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+
+def _to_utc(value: str) -> pd.Timestamp:
+    """Parse an ISO date string as a UTC timestamp, treating naive values as UTC."""
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        return timestamp.tz_localize('UTC')
+    return timestamp.tz_convert('UTC')
@@ -1,19 +1,34 @@
 # filepath: /Users/ahstanin/GitHub/Olib-AI/bizcon/visualization/charts.py
 """
 Visualization functions for benchmark results.
+
+matplotlib and seaborn are imported inside the functions that draw, so
+importing this module (and the dashboard/CLI modules built on it) stays cheap.
 """
-from typing import Dict, List, Any, Optional, Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Union
+import functools
 import json
 import os
+import threading
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib as mpl
-from matplotlib.figure import Figure
-import seaborn as sns
+import pandas as pd
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+
+# Guards matplotlib's global style state when charts are drawn from worker threads
+STYLE_LOCK = threading.Lock()
 
 
 def set_plotting_style():
     """Set consistent styling for all plots."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
     # Set the style
     try:
         plt.style.use('seaborn-v0_8-whitegrid')
@@ -26,22 +41,80 @@ def set_plotting_style():
     # Set fonts
     plt.rcParams.update({
         'font.family': 'sans-serif',
-        'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans', 'Bitstream Vera Sans', 'sans-serif'],
+        # DejaVu Sans ships with matplotlib, so no fallback font search is needed
+        'font.sans-serif': ['DejaVu Sans'],
         'axes.labelsize': 14,
         'axes.titlesize': 16,
         'xtick.labelsize': 12,
         'ytick.labelsize': 12,
         'legend.fontsize': 12,
-        'figure.titlesize': 18
+        'figure.titlesize': 18,
+        # Charts are viewed on screen; pixel count drives PNG encode time and size
+        'figure.dpi': 100,
+        'savefig.dpi': 120
     })
     
     # Set color palette
     sns.set_palette('viridis')
 
 
+# Above this many cells the heatmap is drawn without per-cell score labels,
+# whose Text artists would otherwise dominate render time
+HEATMAP_ANNOTATION_LIMIT = 100
+
+# zlib level 1 encodes flat-colour chart PNGs several times faster than the
+# default level 6 for only a slightly larger file (see matplotlib's WebAgg PNG benchmarks)
+PNG_PIL_KWARGS = {'compress_level': 1, 'optimize': False}
+
+
+def _save_figure(fig: Figure, save_path: str):
+    """Save a chart, using fast PNG compression when writing a PNG."""
+    if str(save_path).lower().endswith('.png'):
+        fig.savefig(save_path, bbox_inches='tight', dpi=120, pil_kwargs=PNG_PIL_KWARGS)
+    else:
+        fig.savefig(save_path, bbox_inches='tight', dpi=120)
+
+
+def _figure_and_axes(ax: Optional[Axes], figsize, **subplot_kw):
+    """Return a new figure and axes, or reuse the caller's axes resized to figsize.
+
+    Figures use constrained layout, which is solved during draw instead of
+    needing separate tight_layout passes.
+    """
+    import matplotlib.pyplot as plt
+    
+    if ax is None:
+        return plt.subplots(figsize=figsize, layout='constrained', subplot_kw=subplot_kw or None)
+    ax.figure.set_size_inches(figsize)
+    ax.figure.set_layout_engine('constrained')
+    return ax.figure, ax
+
+
+@functools.lru_cache(maxsize=16)
+def _radar_angles(n: int) -> np.ndarray:
+    """Angles for an n-axis radar chart, with the first angle repeated to close the loop."""
+    angles = np.linspace(0, 2*np.pi, n, endpoint=False)
+    angles = np.concatenate([angles, angles[:1]])
+    angles.flags.writeable = False  # Shared between calls through the cache
+    return angles
+
+
+def _score_matrix(results: Dict[str, Dict[str, float]], columns: List[str],
+                  dtype: type = np.float32) -> np.ndarray:
+    """
+    Stack per-model score dicts into a (models x columns) matrix; missing scores are 0.
+    
+    float32 is enough for drawing, but charts that print values must ask for
+    float64: float32 rounds e.g. 7.45 down to 7.4 when formatted with .1f.
+    """
+    frame = pd.DataFrame.from_dict(results, orient='index')
+    return frame.reindex(index=list(results.keys()), columns=columns).fillna(0).to_numpy(dtype=dtype)
+
+
 def model_comparison_radar(
     results: Dict[str, Dict[str, float]], 
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    ax: Optional[Axes] = None
 ) -> Figure:
     """
     Create a radar chart comparing model performance across evaluator dimensions.
@@ -49,6 +122,7 @@ def model_comparison_radar(
     Args:
         results: Dictionary mapping model names to dictionaries of evaluator scores
         save_path: Optional path to save the chart image
+        ax: Optional existing polar axes to draw on instead of creating a new figure
         
     Returns:
         Matplotlib figure
@@ -60,10 +134,9 @@ def model_comparison_radar(
     model_names = list(results.keys())
     
     # Set up the radar chart
-    angles = np.linspace(0, 2*np.pi, len(evaluator_categories), endpoint=False).tolist()
-    angles += angles[:1]  # Close the loop
+    angles = _radar_angles(len(evaluator_categories))
     
-    fig, ax = plt.subplots(figsize=(10, 8), subplot_kw=dict(polar=True))
+    fig, ax = _figure_and_axes(ax, (10, 8), polar=True)
     
     # Add evaluator labels
     ax.set_xticks(angles[:-1])
@@ -73,31 +146,29 @@ def model_comparison_radar(
     ax.set_yticks([2, 4, 6, 8, 10])
     ax.set_ylim(0, 10)
     
-    # Plot each model
-    for i, model_name in enumerate(model_names):
-        values = [results[model_name][cat] for cat in evaluator_categories]
-        values += values[:1]  # Close the loop
-        
+    # Plot each model, closing each polygon by repeating its first score
+    score_matrix = _score_matrix(results, evaluator_categories)
+    closed_matrix = np.hstack([score_matrix, score_matrix[:, :1]])
+    for model_name, values in zip(model_names, closed_matrix):
         ax.plot(angles, values, linewidth=2, linestyle='solid', 
                 label=model_name, alpha=0.8)
         ax.fill(angles, values, alpha=0.1)
     
     # Add legend and title
     ax.legend(loc='upper right', bbox_to_anchor=(0.1, 0.1))
-    plt.title('Model Performance Comparison by Evaluator Category', size=18, pad=20)
-    
-    plt.tight_layout()
+    ax.set_title('Model Performance Comparison by Evaluator Category', size=18, pad=20)
     
     # Save if requested
     if save_path:
-        plt.savefig(save_path, bbox_inches='tight', dpi=300)
+        _save_figure(fig, save_path)
     
     return fig
 
 
 def scenario_comparison_heatmap(
     results: Dict[str, Dict[str, float]], 
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    ax: Optional[Axes] = None
 ) -> Figure:
     """
     Create a heatmap comparing model performance across scenarios.
@@ -105,6 +176,7 @@ def scenario_comparison_heatmap(
     Args:
         results: Dictionary mapping model names to dictionaries of scenario scores
         save_path: Optional path to save the chart image
+        ax: Optional existing axes to draw on instead of creating a new figure
         
     Returns:
         Matplotlib figure
@@ -115,47 +187,51 @@ def scenario_comparison_heatmap(
     model_names = list(results.keys())
     scenario_names = list(list(results.values())[0].keys())
     
-    score_matrix = np.zeros((len(model_names), len(scenario_names)))
-    for i, model in enumerate(model_names):
-        for j, scenario in enumerate(scenario_names):
-            score_matrix[i, j] = results[model][scenario]
+    # float64 so the cell annotations match the scores
+    score_matrix = _score_matrix(results, scenario_names, dtype=np.float64)
     
     # Create heatmap
-    fig, ax = plt.subplots(figsize=(max(10, len(scenario_names)), max(8, len(model_names) * 0.6)))
-    
-    # Plot heatmap
-    heatmap = sns.heatmap(
-        score_matrix, 
-        annot=True, 
-        fmt=".1f", 
-        cmap="viridis", 
-        cbar_kws={"label": "Score (0-10)"},
-        linewidths=.5,
-        ax=ax,
-        vmin=0,
-        vmax=10
-    )
+    fig, ax = _figure_and_axes(ax, (max(10, len(scenario_names)), max(8, len(model_names) * 0.6)))
+    
+    # Plot heatmap as a single image; per-cell text is only added while it stays cheap
+    image = ax.imshow(score_matrix, cmap="viridis", vmin=0, vmax=10, aspect='auto', interpolation='nearest')
+    fig.colorbar(image, ax=ax, label="Score (0-10)")
+    
+    if score_matrix.size < HEATMAP_ANNOTATION_LIMIT:
+        from seaborn.utils import relative_luminance
+        for (i, j), value in np.ndenumerate(score_matrix):
+            luminance = relative_luminance(image.cmap(image.norm(value)))
+            ax.text(j, i, f'{value:.1f}', ha='center', va='center',
+                    color='.15' if luminance > .408 else 'w')
+    
+    # Separate cells with thin white lines
+    ax.set_xticks(np.arange(-.5, len(scenario_names)), minor=True)
+    ax.set_yticks(np.arange(-.5, len(model_names)), minor=True)
+    ax.grid(False)
+    ax.grid(which='minor', color='white', linewidth=.5)
+    ax.tick_params(which='minor', length=0)
     
     # Set labels
+    ax.set_yticks(np.arange(len(model_names)))
     ax.set_yticklabels(model_names, rotation=0)
+    ax.set_xticks(np.arange(len(scenario_names)))
     ax.set_xticklabels([name.replace('_', ' ').title() for name in scenario_names], rotation=45, ha='right')
     
     ax.set_title('Model Performance by Scenario Type', pad=20)
     ax.set_xlabel('Scenario', labelpad=10)
     ax.set_ylabel('Model', labelpad=10)
     
-    plt.tight_layout()
-    
     # Save if requested
     if save_path:
-        plt.savefig(save_path, bbox_inches='tight', dpi=300)
+        _save_figure(fig, save_path)
     
     return fig
 
 
 def tool_usage_bar_chart(
     results: Dict[str, Dict[str, Any]], 
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    ax: Optional[Axes] = None
 ) -> Figure:
     """
     Create a bar chart showing tool usage metrics by model.
@@ -163,6 +239,7 @@ def tool_usage_bar_chart(
     Args:
         results: Dictionary mapping model names to dictionaries of tool usage metrics
         save_path: Optional path to save the chart image
+        ax: Optional existing axes to draw on instead of creating a new figure
         
     Returns:
         Matplotlib figure
@@ -173,15 +250,15 @@ def tool_usage_bar_chart(
     metrics = ['tool_selection', 'parameter_quality', 'call_efficiency', 'result_interpretation']
     
     # Create figure
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = _figure_and_axes(ax, (12, 8))
     
     x = np.arange(len(model_names))
     width = 0.2
     multiplier = 0
     
     # Plot bars for each metric
-    for metric in metrics:
-        metric_scores = [results[model].get(metric, 0) for model in model_names]
+    score_matrix = _score_matrix(results, metrics)
+    for metric, metric_scores in zip(metrics, score_matrix.T):
         offset = width * multiplier
         rects = ax.bar(x + offset, metric_scores, width, label=metric.replace('_', ' ').title())
         multiplier += 1
@@ -194,18 +271,17 @@ def tool_usage_bar_chart(
     ax.set_ylim(0, 10)
     ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=len(metrics))
     
-    plt.tight_layout()
-    
     # Save if requested
     if save_path:
-        plt.savefig(save_path, bbox_inches='tight', dpi=300)
+        _save_figure(fig, save_path)
     
     return fig
 
 
 def performance_trend_line(
     turn_scores: Dict[str, List[float]], 
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    ax: Optional[Axes] = None
 ) -> Figure:
     """
     Create a line chart showing score trends across conversation turns.
@@ -213,17 +289,19 @@ def performance_trend_line(
     Args:
         turn_scores: Dictionary mapping model names to lists of scores by turn
         save_path: Optional path to save the chart image
+        ax: Optional existing axes to draw on instead of creating a new figure
         
     Returns:
         Matplotlib figure
     """
     set_plotting_style()
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _figure_and_axes(ax, (12, 6))
     
     # Plot each model's scores
     for model_name, scores in turn_scores.items():
-        turns = list(range(1, len(scores) + 1))
+        scores = np.asarray(scores, dtype=np.float32)
+        turns = np.arange(1, len(scores) + 1)
         ax.plot(turns, scores, marker='o', linewidth=2, markersize=8, label=model_name)
     
     # Add labels and title
@@ -241,18 +319,17 @@ def performance_trend_line(
     ax.grid(True, linestyle='--', alpha=0.7)
     ax.legend(loc='best')
     
-    plt.tight_layout()
-    
     # Save if requested
     if save_path:
-        plt.savefig(save_path, bbox_inches='tight', dpi=300)
+        _save_figure(fig, save_path)
     
     return fig
 
 
 def breakdown_stacked_bar(
     results: Dict[str, Dict[str, float]], 
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    ax: Optional[Axes] = None
 ) -> Figure:
     """
     Create a stacked bar chart showing score breakdowns by evaluator category.
@@ -260,6 +337,7 @@ def breakdown_stacked_bar(
     Args:
         results: Dictionary mapping model names to dictionaries of evaluator scores
         save_path: Optional path to save the chart image
+        ax: Optional existing axes to draw on instead of creating a new figure
         
     Returns:
         Matplotlib figure
@@ -270,40 +348,38 @@ def breakdown_stacked_bar(
     categories = list(list(results.values())[0].keys())
     
     # Create figure
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = _figure_and_axes(ax, (12, 8))
     
-    # Plot stacked bars
-    bottom = np.zeros(len(model_names))
+    # Plot stacked bars; each category sits on the cumulative sum of the ones before it
+    # float64 so the printed totals match the scores
+    score_matrix = _score_matrix(results, categories, dtype=np.float64)
+    cumulative = np.cumsum(score_matrix, axis=1)
+    bottoms = cumulative - score_matrix
     
-    for category in categories:
-        values = [results[model][category] for model in model_names]
-        ax.bar(model_names, values, bottom=bottom, label=category.replace('_', ' ').title())
-        bottom += values
+    for j, category in enumerate(categories):
+        rects = ax.bar(model_names, score_matrix[:, j], bottom=bottoms[:, j], label=category.replace('_', ' ').title())
     
     # Add labels, title and legend
     ax.set_ylabel('Cumulative Score')
     ax.set_title('Score Breakdown by Evaluator Category')
     ax.set_ylim(0, len(categories) * 10)  # Assuming each category has max score of 10
     
-    # Add total scores on top of bars
-    for i, model in enumerate(model_names):
-        total = sum(results[model].values())
-        ax.text(i, total + 1, f'Total: {total:.1f}', ha='center')
+    # Add total scores on top of the topmost segment of each bar
+    ax.bar_label(rects, labels=[f'Total: {total:.1f}' for total in cumulative[:, -1]], padding=3)
     
     ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=len(categories))
     
-    plt.tight_layout()
-    
     # Save if requested
     if save_path:
-        plt.savefig(save_path, bbox_inches='tight', dpi=300)
+        _save_figure(fig, save_path)
     
     return fig
 
 
 def success_rate_chart(
     success_rates: Dict[str, Dict[str, float]], 
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    ax: Optional[Axes] = None
 ) -> Figure:
     """
     Create a grouped bar chart showing success rates by category.
@@ -311,6 +387,7 @@ def success_rate_chart(
     Args:
         success_rates: Dictionary mapping model names to dictionaries of success rates
         save_path: Optional path to save the chart image
+        ax: Optional existing axes to draw on instead of creating a new figure
         
     Returns:
         Matplotlib figure
@@ -321,16 +398,19 @@ def success_rate_chart(
     categories = list(list(success_rates.values())[0].keys())
     
     # Create figure
-    fig, ax = plt.subplots(figsize=(max(12, len(categories) * 1.5), 8))
+    fig, ax = _figure_and_axes(ax, (max(12, len(categories) * 1.5), 8))
     
     x = np.arange(len(categories))
     width = 0.8 / len(model_names)
     
     # Plot bars for each model
-    for i, model_name in enumerate(model_names):
-        rates = [success_rates[model_name][cat] * 100 for cat in categories]  # Convert to percentage
+    # Convert to percentage; float64 so the printed labels match the rates
+    rate_matrix = _score_matrix(success_rates, categories, dtype=np.float64) * 100
+    for i, (model_name, rates) in enumerate(zip(model_names, rate_matrix)):
         offset = width * i - width * (len(model_names) - 1) / 2
-        ax.bar(x + offset, rates, width, label=model_name)
+        rects = ax.bar(x + offset, rates, width, label=model_name)
+        # Add percentage labels on bars
+        ax.bar_label(rects, fmt='%.0f%%', padding=2, fontsize=9)
     
     # Add labels, title and legend
     ax.set_ylabel('Success Rate (%)')
@@ -339,19 +419,10 @@ def success_rate_chart(
     ax.set_xticklabels([cat.replace('_', ' ').title() for cat in categories], rotation=45, ha='right')
     ax.set_ylim(0, 100)
     
-    # Add percentage labels on bars
-    for i, model in enumerate(model_names):
-        for j, cat in enumerate(categories):
-            rate = success_rates[model][cat] * 100
-            offset = width * i - width * (len(model_names) - 1) / 2
-            ax.text(j + offset, rate + 2, f'{rate:.0f}%', ha='center', va='bottom', fontsize=9)
-    
     ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=min(len(model_names), 3))
     
-    plt.tight_layout()
-    
     # Save if requested
     if save_path:
-        plt.savefig(save_path, bbox_inches='tight', dpi=300)
+        _save_figure(fig, save_path)
     
     return fig
\ No newline at end of file
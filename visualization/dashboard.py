@@ -2,19 +2,35 @@
 """
 Interactive web dashboard for visualizing benchmark results.
 """
-from typing import Dict, List, Any, Optional, Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Union
 import json
 import os
-import io
-import base64
 import datetime
 import tempfile
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import matplotlib
 import pandas as pd
 import numpy as np
-from flask import Flask, render_template, send_from_directory, jsonify
+from flask import Flask, render_template_string, send_file, send_from_directory, jsonify
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    from waitress import serve as waitress_serve
+except ImportError:  # Optional: falls back to Flask's threaded development server
+    waitress_serve = None
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 from visualization.charts import (
     model_comparison_radar,
@@ -22,9 +38,125 @@ from visualization.charts import (
     tool_usage_bar_chart,
     performance_trend_line,
     breakdown_stacked_bar,
-    success_rate_chart
+    success_rate_chart,
+    set_plotting_style,
+    STYLE_LOCK,
+    PNG_PIL_KWARGS
 )
 
+CHART_TYPES = ('radar', 'heatmap', 'tool_usage', 'trends', 'breakdown', 'success_rate')
+
+DASHBOARD_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }}</title>
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.2.3/dist/css/bootstrap.min.css" rel="stylesheet">
+    <style>
+        .chart-container {
+            margin-bottom: 2rem;
+            border: 1px solid #ddd;
+            border-radius: 5px;
+            padding: 1rem;
+            background-color: white;
+        }
+        body {
+            background-color: #f8f9fa;
+            padding-top: 2rem;
+            padding-bottom: 2rem;
+        }
+        .chart-img {
+            width: 100%;
+            height: auto;
+        }
+        h1, h2, h3 {
+            color: #343a40;
+        }
+        .timestamp {
+            color: #6c757d;
+            font-size: 0.9rem;
+            margin-bottom: 1.5rem;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="row mb-4">
+            <div class="col-12">
+                <h1 class="text-center">bizCon Benchmark Dashboard</h1>
+                <p class="timestamp text-center">Generated on {{ timestamp }}</p>
+            </div>
+        </div>
+
+        <div class="row">
+            <div class="col-12">
+                <div class="chart-container">
+                    <h3>Model Performance by Evaluator Category</h3>
+                    <img id="radar-chart" class="chart-img" src="/api/charts/radar?v={{ chart_version }}" alt="Radar Chart">
+                </div>
+            </div>
+        </div>
+
+        <div class="row">
+            <div class="col-md-6">
+                <div class="chart-container">
+                    <h3>Performance by Scenario</h3>
+                    <img id="heatmap-chart" class="chart-img" src="/api/charts/heatmap?v={{ chart_version }}" alt="Heatmap Chart">
+                </div>
+            </div>
+            <div class="col-md-6">
+                <div class="chart-container">
+                    <h3>Tool Usage Performance</h3>
+                    <img id="tool-usage-chart" class="chart-img" src="/api/charts/tool_usage?v={{ chart_version }}" alt="Tool Usage Chart">
+                </div>
+            </div>
+        </div>
+
+        <div class="row">
+            <div class="col-md-6">
+                <div class="chart-container">
+                    <h3>Score Breakdown</h3>
+                    <img id="breakdown-chart" class="chart-img" src="/api/charts/breakdown?v={{ chart_version }}" alt="Breakdown Chart">
+                </div>
+            </div>
+            <div class="col-md-6">
+                <div class="chart-container">
+                    <h3>Success Rates</h3>
+                    <img id="success-rate-chart" class="chart-img" src="/api/charts/success_rate?v={{ chart_version }}" alt="Success Rate Chart">
+                </div>
+            </div>
+        </div>
+
+        <div class="row">
+            <div class="col-12">
+                <div class="chart-container">
+                    <h3>Performance Across Conversation Turns</h3>
+                    <img id="trends-chart" class="chart-img" src="/api/charts/trends?v={{ chart_version }}" alt="Trends Chart">
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+def _parse_json(raw: bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _overall_field(results: Dict[str, Any], field: str) -> Dict[str, Dict[str, Any]]:
+    """Collect one per-model `overall` sub-dict into a model -> {key: value} mapping, filling gaps with 0."""
+    frame = pd.DataFrame.from_dict(
+        {model: model_data.get('overall', {}).get(field, {}) for model, model_data in results.items()},
+        orient='index'
+    )
+    return frame.reindex(list(results.keys())).fillna(0).to_dict(orient='index')
+
 
 class BenchmarkDashboard:
     """Interactive dashboard for visualizing benchmark results."""
@@ -46,19 +178,29 @@ class BenchmarkDashboard:
         self.port = port
         self.app = self._create_app()
         self._cached_results = None
+        self._results_fingerprint = None
+        self._file_cache: Dict[Path, Tuple[float, dict]] = {}  # path -> (mtime, parsed JSON)
+        self._rendered_fingerprint = None
+        self._render_lock = threading.Lock()
+        # One reusable figure per chart type, redrawn on each render
+        from matplotlib.figure import Figure
+        self._figures: Dict[str, Figure] = {chart_type: Figure() for chart_type in CHART_TYPES}
         self._temp_dir = tempfile.TemporaryDirectory()
         self.static_dir = Path(self._temp_dir.name)
     
     def _create_app(self) -> Flask:
         """Create the Flask application for the dashboard."""
-        app = Flask(__name__)
+        # Disable Flask's built-in static route so /static serves the rendered charts
+        app = Flask(__name__, static_folder=None)
         
         @app.route('/')
         def index():
             """Render the main dashboard page."""
-            return render_template('dashboard.html', 
-                                  title='bizCon Benchmark Dashboard',
-                                  timestamp=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            self._ensure_charts()
+            return render_template_string(DASHBOARD_TEMPLATE,
+                                          title='bizCon Benchmark Dashboard',
+                                          timestamp=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                                          chart_version=self._chart_version())
         
         @app.route('/api/results')
         def results():
@@ -75,255 +217,176 @@ class BenchmarkDashboard:
         def scenarios():
             """API endpoint for getting the list of scenarios."""
             results = self._load_results()
-            scenarios = set()
-            for model_results in results.values():
-                for run in model_results.get('runs', []):
-                    scenarios.add(run.get('scenario', {}).get('name', ''))
+            scenarios = {
+                run.get('scenario', {}).get('name', '')
+                for model_results in results.values()
+                for run in model_results.get('runs', ())
+            }
             return jsonify(list(scenarios))
         
         @app.route('/api/charts/<chart_type>')
         def charts(chart_type):
-            """API endpoint for generating chart images."""
-            results = self._load_results()
-            
-            # Generate the chart based on type
-            if chart_type == 'radar':
-                # Prepare data for radar chart
-                evaluator_scores = {}
-                for model, model_data in results.items():
-                    evaluator_scores[model] = {}
-                    for evaluator, score in model_data.get('overall', {}).get('evaluator_scores', {}).items():
-                        evaluator_scores[model][evaluator] = score
-                
-                fig = model_comparison_radar(evaluator_scores)
-            
-            elif chart_type == 'heatmap':
-                # Prepare data for heatmap
-                scenario_scores = {}
-                for model, model_data in results.items():
-                    scenario_scores[model] = {}
-                    for run in model_data.get('runs', []):
-                        scenario_name = run.get('scenario', {}).get('name', '')
-                        scenario_scores[model][scenario_name] = run.get('overall_score', 0)
-                
-                fig = scenario_comparison_heatmap(scenario_scores)
-            
-            elif chart_type == 'tool_usage':
-                # Prepare data for tool usage chart
-                tool_metrics = {}
-                for model, model_data in results.items():
-                    tool_metrics[model] = {}
-                    for metric, score in model_data.get('overall', {}).get('tool_usage', {}).items():
-                        tool_metrics[model][metric] = score
-                
-                fig = tool_usage_bar_chart(tool_metrics)
-            
-            elif chart_type == 'trends':
-                # Prepare data for performance trend line
-                turn_scores = {}
-                for model, model_data in results.items():
-                    scores = []
-                    for run in model_data.get('runs', []):
-                        for turn in run.get('turns', []):
-                            scores.append(turn.get('score', 0))
-                    if scores:
-                        turn_scores[model] = scores
-                
-                fig = performance_trend_line(turn_scores)
-            
-            elif chart_type == 'breakdown':
-                # Prepare data for breakdown chart
-                breakdown = {}
-                for model, model_data in results.items():
-                    breakdown[model] = {}
-                    for category, score in model_data.get('overall', {}).get('category_scores', {}).items():
-                        breakdown[model][category] = score
-                
-                fig = breakdown_stacked_bar(breakdown)
-            
-            elif chart_type == 'success_rate':
-                # Prepare data for success rate chart
-                success_rates = {}
-                for model, model_data in results.items():
-                    success_rates[model] = {}
-                    for category, rate in model_data.get('overall', {}).get('success_rates', {}).items():
-                        success_rates[model][category] = rate
-                
-                fig = success_rate_chart(success_rates)
-            
-            else:
+            """API endpoint for chart images, served as PNG bytes."""
+            if chart_type not in CHART_TYPES:
                 return jsonify({'error': f'Unknown chart type: {chart_type}'}), 400
             
-            # Convert plot to base64 image
-            img_data = io.BytesIO()
-            fig.savefig(img_data, format='png', bbox_inches='tight')
-            img_data.seek(0)
-            plt.close(fig)
-            
-            img_base64 = base64.b64encode(img_data.getvalue()).decode('utf-8')
-            return jsonify({'image': f'data:image/png;base64,{img_base64}'})
+            self._ensure_charts()
+            chart_path = self.static_dir / f'{chart_type}.png'
+            if not chart_path.exists():
+                return jsonify({'error': f'Could not render chart: {chart_type}'}), 500
+            return send_file(chart_path, mimetype='image/png', download_name=f'{chart_type}.png')
         
         @app.route('/static/<path:path>')
         def send_static(path):
             """Serve static files."""
             return send_from_directory(self.static_dir, path)
         
-        # Generate template directory with HTML files
-        self._create_template_files()
-        
         return app
     
     def _load_results(self) -> Dict[str, Any]:
-        """Load benchmark results from JSON files."""
-        if self._cached_results:
+        """Load benchmark results from JSON files, reloading only when they change."""
+        fingerprint = self._compute_fingerprint()
+        if self._cached_results is not None and fingerprint == self._results_fingerprint:
             return self._cached_results
         
         results = {}
-        for json_file in self.results_dir.glob('*.json'):
+        file_cache = {}
+        for name, mtime in fingerprint:
+            json_file = self.results_dir / name
             try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
+                cached = self._file_cache.get(json_file)
+                if cached is not None and cached[0] == mtime:
+                    data = cached[1]
+                else:
+                    data = _parse_json(json_file.read_bytes())
+                file_cache[json_file] = (mtime, data)
                     
                 model_name = data.get('model_name', json_file.stem)
                 results[model_name] = data
             except Exception as e:
                 print(f"Error loading {json_file}: {e}")
         
+        self._file_cache = file_cache
         self._cached_results = results
+        self._results_fingerprint = fingerprint
         return results
     
-    def _create_template_files(self):
-        """Create HTML template files for the dashboard."""
-        os.makedirs(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates'), exist_ok=True)
+    def _compute_fingerprint(self) -> tuple:
+        """Fingerprint the results directory as sorted (file name, mtime) pairs of its JSON files."""
+        try:
+            with os.scandir(self.results_dir) as entries:
+                return tuple(sorted(
+                    (entry.name, entry.stat().st_mtime)
+                    for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()
+                ))
+        except FileNotFoundError:
+            return ()
+    
+    def _chart_version(self) -> str:
+        """Cache-busting token for chart URLs, derived from the results fingerprint."""
+        return f'{zlib.crc32(repr(self._results_fingerprint).encode()):08x}'
+    
+    def _build_chart(self, chart_type: str, results: Dict[str, Any], ax=None) -> Figure:
+        """Prepare the data for a chart type and draw it, optionally onto existing axes."""
+        if chart_type == 'radar':
+            # Prepare data for radar chart
+            return model_comparison_radar(_overall_field(results, 'evaluator_scores'), ax=ax)
         
-        # Create dashboard HTML template
-        dashboard_html = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{{ title }}</title>
-            <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.2.3/dist/css/bootstrap.min.css" rel="stylesheet">
-            <style>
-                .chart-container {
-                    margin-bottom: 2rem;
-                    border: 1px solid #ddd;
-                    border-radius: 5px;
-                    padding: 1rem;
-                    background-color: white;
-                }
-                body {
-                    background-color: #f8f9fa;
-                    padding-top: 2rem;
-                    padding-bottom: 2rem;
-                }
-                .chart-img {
-                    width: 100%;
-                    height: auto;
-                }
-                h1, h2, h3 {
-                    color: #343a40;
-                }
-                .timestamp {
-                    color: #6c757d;
-                    font-size: 0.9rem;
-                    margin-bottom: 1.5rem;
-                }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="row mb-4">
-                    <div class="col-12">
-                        <h1 class="text-center">bizCon Benchmark Dashboard</h1>
-                        <p class="timestamp text-center">Generated on {{ timestamp }}</p>
-                    </div>
-                </div>
-                
-                <div class="row">
-                    <div class="col-12">
-                        <div class="chart-container">
-                            <h3>Model Performance by Evaluator Category</h3>
-                            <img id="radar-chart" class="chart-img" src="" alt="Radar Chart">
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="row">
-                    <div class="col-md-6">
-                        <div class="chart-container">
-                            <h3>Performance by Scenario</h3>
-                            <img id="heatmap-chart" class="chart-img" src="" alt="Heatmap Chart">
-                        </div>
-                    </div>
-                    <div class="col-md-6">
-                        <div class="chart-container">
-                            <h3>Tool Usage Performance</h3>
-                            <img id="tool-usage-chart" class="chart-img" src="" alt="Tool Usage Chart">
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="row">
-                    <div class="col-md-6">
-                        <div class="chart-container">
-                            <h3>Score Breakdown</h3>
-                            <img id="breakdown-chart" class="chart-img" src="" alt="Breakdown Chart">
-                        </div>
-                    </div>
-                    <div class="col-md-6">
-                        <div class="chart-container">
-                            <h3>Success Rates</h3>
-                            <img id="success-rate-chart" class="chart-img" src="" alt="Success Rate Chart">
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="row">
-                    <div class="col-12">
-                        <div class="chart-container">
-                            <h3>Performance Across Conversation Turns</h3>
-                            <img id="trends-chart" class="chart-img" src="" alt="Trends Chart">
-                        </div>
-                    </div>
-                </div>
-            </div>
+        if chart_type == 'heatmap':
+            # Prepare data for heatmap
+            scenario_scores = {}
+            for model, model_data in results.items():
+                scenario_scores[model] = {}
+                for run in model_data.get('runs', []):
+                    scenario_name = run.get('scenario', {}).get('name', '')
+                    scenario_scores[model][scenario_name] = run.get('overall_score', 0)
             
-            <script>
-                // Load chart images
-                window.onload = function() {
-                    const chartTypes = ['radar', 'heatmap', 'tool_usage', 'breakdown', 'success_rate', 'trends'];
-                    
-                    chartTypes.forEach(type => {
-                        fetch(`/api/charts/${type}`)
-                            .then(response => response.json())
-                            .then(data => {
-                                if (data.image) {
-                                    let chartId = '';
-                                    if (type === 'tool_usage') {
-                                        chartId = 'tool-usage-chart';
-                                    } else {
-                                        chartId = `${type}-chart`;
-                                    }
-                                    document.getElementById(chartId).src = data.image;
-                                }
-                            })
-                            .catch(error => console.error(`Error loading ${type} chart:`, error));
-                    });
-                };
-            </script>
-        </body>
-        </html>
-        """
+            return scenario_comparison_heatmap(scenario_scores, ax=ax)
+        
+        if chart_type == 'tool_usage':
+            # Prepare data for tool usage chart
+            return tool_usage_bar_chart(_overall_field(results, 'tool_usage'), ax=ax)
+        
+        if chart_type == 'trends':
+            # Prepare data for performance trend line
+            turn_scores = {
+                model: scores
+                for model, model_data in results.items()
+                if (scores := [turn.get('score', 0)
+                               for run in model_data.get('runs', ())
+                               for turn in run.get('turns', ())])
+            }
+            
+            return performance_trend_line(turn_scores, ax=ax)
+        
+        if chart_type == 'breakdown':
+            # Prepare data for breakdown chart
+            return breakdown_stacked_bar(_overall_field(results, 'category_scores'), ax=ax)
         
-        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates', 'dashboard.html'), 'w') as f:
-            f.write(dashboard_html)
+        if chart_type == 'success_rate':
+            # Prepare data for success rate chart
+            return success_rate_chart(_overall_field(results, 'success_rates'), ax=ax)
+        
+        raise ValueError(f'Unknown chart type: {chart_type}')
+    
+    def _render_chart(self, chart_type: str, results: Dict[str, Any]) -> Path:
+        """Redraw one chart on its pooled figure and write it to the static directory."""
+        fig = self._figures[chart_type]
+        # Style is applied through global rcParams, so only drawing is serialized;
+        # rasterization below runs concurrently.
+        with STYLE_LOCK:
+            set_plotting_style()
+            fig.clear()
+            ax = fig.add_subplot(111, polar=(chart_type == 'radar'))
+            self._build_chart(chart_type, results, ax=ax)
+        
+        # Write beside the final file and swap it in atomically, so a request
+        # still streaming the previous PNG never sees a truncated image
+        path = self.static_dir / f'{chart_type}.png'
+        with tempfile.NamedTemporaryFile(dir=self.static_dir, prefix=f'.{chart_type}-',
+                                         suffix='.png', delete=False) as tmp:
+            tmp_path = tmp.name
+        try:
+            fig.savefig(tmp_path, format='png', dpi=100, bbox_inches='tight',
+                        pil_kwargs=PNG_PIL_KWARGS)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+    
+    def _ensure_charts(self):
+        """Render all charts in parallel whenever the results have changed."""
+        with self._render_lock:
+            results = self._load_results()
+            if self._rendered_fingerprint == self._results_fingerprint:
+                return
+            
+            with ThreadPoolExecutor(max_workers=len(CHART_TYPES)) as executor:
+                futures = {
+                    executor.submit(self._render_chart, chart_type, results): chart_type
+                    for chart_type in CHART_TYPES
+                }
+                for future, chart_type in futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        (self.static_dir / f'{chart_type}.png').unlink(missing_ok=True)
+                        print(f"Error rendering {chart_type} chart: {e}")
+            
+            self._rendered_fingerprint = self._results_fingerprint
     
     def start(self):
         """Start the dashboard server."""
         print(f"Starting bizCon dashboard on http://{self.host}:{self.port}")
-        self.app.run(host=self.host, port=self.port, debug=False)
+        # The server renders off-screen only; pin Agg so headless hosts never probe Tk/Qt
+        matplotlib.use('Agg', force=True)
+        self._ensure_charts()
+        if waitress_serve is not None:
+            waitress_serve(self.app, host=self.host, port=self.port, threads=8)
+        else:
+            self.app.run(host=self.host, port=self.port, debug=False, threaded=True)
     
     def __del__(self):
         """Clean up temporary files."""
@@ -1,27 +1,94 @@
 """
 Interactive charts using Plotly for advanced visualization dashboard.
 """
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple, Union
+import functools
+import itertools
 import json
+from collections import defaultdict
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to plotly's stdlib-json engine
+    orjson = None
+
+
+def figure_to_json(fig: go.Figure) -> str:
+    """Serialize a figure to a JSON string, encoding with orjson when it is installed."""
+    return pio.to_json(fig, validate=False, engine='orjson' if orjson is not None else 'json')
+
+
+@functools.lru_cache(maxsize=32)
+def _cluster_leaf_order(matrix_bytes: bytes, shape: Tuple[int, int]) -> Tuple[int, ...]:
+    """Ward-linkage dendrogram leaf order for a float64 matrix given as raw bytes."""
+    from scipy.cluster.hierarchy import leaves_list, linkage
+    from scipy.spatial.distance import pdist
+    
+    matrix = np.frombuffer(matrix_bytes, dtype=np.float64).reshape(shape)
+    distances = pdist(matrix, metric='euclidean')
+    # leaves_list gives the dendrogram's leaf order without computing drawing coordinates
+    return tuple(leaves_list(linkage(distances, method='ward')).tolist())
+
+
+# One Viridis stop per whole score point (0-9), for integer-bucketed line colours
+SCORE_BUCKET_COLORSCALE = [
+    [i / 9, color] for i, color in enumerate(px.colors.sequential.Viridis)
+]
+
+
+class ScoreTable(NamedTuple):
+    """Per-model scores as one dense (models x metrics) array; metrics a model lacks are NaN."""
+    models: List[str]
+    metrics: List[str]
+    matrix: np.ndarray
+    
+    @classmethod
+    def from_results(cls, results: Dict[str, Dict[str, float]]) -> 'ScoreTable':
+        """Flatten a model -> {metric: score} mapping; metrics keep first-seen order."""
+        models = list(results.keys())
+        metrics = list(dict.fromkeys(metric for scores in results.values() for metric in scores))
+        matrix = np.array(
+            [[scores.get(metric, np.nan) for metric in metrics] for scores in results.values()],
+            dtype=np.float64
+        ).reshape(len(models), len(metrics))
+        return cls(models, metrics, matrix)
+    
+    def select(self, metrics: List[str], fill: float = 0.0) -> np.ndarray:
+        """Columns for the given metrics in order, with missing scores replaced by fill."""
+        index = {metric: j for j, metric in enumerate(self.metrics)}
+        out = np.full((len(self.models), len(metrics)), fill, dtype=np.float64)
+        for k, metric in enumerate(metrics):
+            if metric in index:
+                out[:, k] = self.matrix[:, index[metric]]
+        return np.where(np.isnan(out), fill, out)
+
 
 class InteractiveCharts:
     """Generator for interactive Plotly charts."""
     
+    # Above this many points scatter traces are rendered with WebGL (scattergl)
+    WEBGL_POINT_THRESHOLD = 1000
+    
     def __init__(self, theme: str = "plotly_white"):
         """Initialize the interactive chart generator."""
         self.theme = theme
         self.color_palette = px.colors.qualitative.Set3
     
+    def _colors(self, n: int) -> List[str]:
+        """The first n palette colors, cycling through the palette as needed."""
+        return np.take(np.asarray(self.color_palette, dtype=object), np.arange(n), mode='wrap').tolist()
+    
     def model_comparison_3d_scatter(
         self,
         results: Dict[str, Dict[str, float]],
-        dimensions: List[str] = None
+        dimensions: List[str] = None,
+        table: Optional[ScoreTable] = None
     ) -> go.Figure:
         """
         Create a 3D scatter plot comparing models across multiple dimensions.
@@ -29,38 +96,46 @@ class InteractiveCharts:
         Args:
             results: Dictionary mapping model names to evaluation scores
             dimensions: List of 3 dimensions to plot (default: first 3)
+            table: Optional ScoreTable already built from results
             
         Returns:
             Plotly figure object
         """
         if not dimensions:
-            dimensions = list(list(results.values())[0].keys())[:3]
-        
-        fig = go.Figure()
-        
-        for i, (model, scores) in enumerate(results.items()):
-            fig.add_trace(go.Scatter3d(
-                x=[scores.get(dimensions[0], 0)],
-                y=[scores.get(dimensions[1], 0)],
-                z=[scores.get(dimensions[2], 0)],
-                mode='markers+text',
-                name=model,
-                text=[model],
-                textposition="top center",
-                marker=dict(
-                    size=12,
-                    color=self.color_palette[i % len(self.color_palette)],
-                    symbol='circle',
-                    line=dict(color='DarkSlateGrey', width=2)
-                )
-            ))
+            dimensions = list(itertools.islice(next(iter(results.values())), 3))
+        
+        # One trace for all models: plotly's build cost grows with the number of traces
+        table = table or ScoreTable.from_results(results)
+        models = table.models
+        coords = table.select(dimensions[:3])
+        colors = self._colors(len(models))
+        labels = [dim.replace('_', ' ').title() for dim in dimensions[:3]]
+        
+        fig = go.Figure(go.Scatter3d(
+            x=coords[:, 0],
+            y=coords[:, 1],
+            z=coords[:, 2],
+            mode='markers+text',
+            text=models,
+            textposition="top center",
+            hovertemplate=(
+                f'<b>%{{text}}</b><br>{labels[0]}: %{{x:.2f}}<br>'
+                f'{labels[1]}: %{{y:.2f}}<br>{labels[2]}: %{{z:.2f}}<extra></extra>'
+            ),
+            marker=dict(
+                size=12,
+                color=colors,
+                symbol='circle',
+                line=dict(color='DarkSlateGrey', width=2)
+            )
+        ))
         
         fig.update_layout(
             title="3D Model Performance Comparison",
             scene=dict(
-                xaxis_title=dimensions[0].replace('_', ' ').title(),
-                yaxis_title=dimensions[1].replace('_', ' ').title(),
-                zaxis_title=dimensions[2].replace('_', ' ').title(),
+                xaxis_title=labels[0],
+                yaxis_title=labels[1],
+                zaxis_title=labels[2],
                 xaxis=dict(range=[0, 10]),
                 yaxis=dict(range=[0, 10]),
                 zaxis=dict(range=[0, 10])
@@ -73,31 +148,37 @@ class InteractiveCharts:
     
     def interactive_radar_chart(
         self,
-        results: Dict[str, Dict[str, float]]
+        results: Dict[str, Dict[str, float]],
+        table: Optional[ScoreTable] = None
     ) -> go.Figure:
         """
         Create an interactive radar chart with hover details.
         
         Args:
             results: Dictionary mapping model names to evaluation scores
+            table: Optional ScoreTable already built from results
             
         Returns:
             Plotly figure object
         """
-        categories = list(list(results.values())[0].keys())
+        categories = list(next(iter(results.values())))
+        
+        theta = categories + [categories[0]]  # Close the polygon
         
         fig = go.Figure()
         
-        for i, (model, scores) in enumerate(results.items()):
-            values = [scores[cat] for cat in categories]
-            values += values[:1]  # Close the polygon
-            
+        table = table or ScoreTable.from_results(results)
+        # Selecting the closed theta list repeats the first column, closing every polygon at once
+        closed_values = table.select(theta)
+        
+        # Each model keeps its own trace so its polygon can be filled
+        for model, model_values, color in zip(table.models, closed_values, self._colors(len(table.models))):
             fig.add_trace(go.Scatterpolar(
-                r=values,
-                theta=categories + [categories[0]],
+                r=model_values,
+                theta=theta,
                 fill='toself',
                 name=model,
-                line_color=self.color_palette[i % len(self.color_palette)],
+                line_color=color,
                 hovertemplate='%{theta}: %{r:.2f}<extra></extra>'
             ))
         
@@ -122,7 +203,7 @@ class InteractiveCharts:
         metric: str = "overall_score"
     ) -> go.Figure:
         """
-        Create an animated timeline showing performance changes.
+        Create a timeline of performance by turn, with a slider to step through turns.
         
         Args:
             turn_scores: Dictionary mapping models to turn-by-turn scores
@@ -131,36 +212,69 @@ class InteractiveCharts:
         Returns:
             Plotly figure object
         """
-        # Prepare data for animation
-        all_data = []
-        for model, turns in turn_scores.items():
-            for i, turn in enumerate(turns):
-                all_data.append({
-                    'Model': model,
-                    'Turn': i + 1,
-                    'Score': turn.get(metric, 0),
-                    'Details': turn.get('details', '')
-                })
-        
-        df = pd.DataFrame(all_data)
-        
-        # Create animated scatter plot
-        fig = px.scatter(
-            df,
-            x="Turn",
-            y="Score",
-            color="Model",
-            animation_frame="Turn",
-            animation_group="Model",
-            size="Score",
-            hover_data=["Details"],
-            range_y=[0, 10],
-            title=f"Performance Timeline: {metric.replace('_', ' ').title()}",
-            template=self.theme
+        # One trace per model carries its full timeline; the slider restyles the
+        # traces in place instead of shipping a copy of every trace per frame
+        models = list(turn_scores.keys())
+        scores = [
+            np.fromiter((turn.get(metric, 0) for turn in turns), dtype=np.float64, count=len(turns)).tolist()
+            for turns in turn_scores.values()
+        ]
+        details = [[turn.get('details', '') for turn in turns] for turns in turn_scores.values()]
+        turn_numbers = [list(range(1, len(turns) + 1)) for turns in turn_scores.values()]
+        max_turns = max(map(len, turn_numbers), default=0)
+        total_points = sum(map(len, turn_numbers))
+        
+        trace_cls = go.Scattergl if total_points > self.WEBGL_POINT_THRESHOLD else go.Scatter
+        
+        fig = go.Figure([
+            trace_cls(
+                x=x,
+                y=y,
+                customdata=custom,
+                mode='markers',
+                name=model,
+                marker=dict(size=12, color=color),
+                hovertemplate=(
+                    f'Model={model}<br>Turn=%{{x}}<br>Score=%{{y}}'
+                    '<br>Details=%{customdata}<extra></extra>'
+                )
+            )
+            for model, x, y, custom, color in zip(models, turn_numbers, scores, details, self._colors(len(models)))
+        ])
+        
+        def turn_step(turn: int) -> dict:
+            """Slider step restyling every trace down to its point at this turn (if any)."""
+            index = turn - 1
+            return dict(
+                label=str(turn),
+                method='restyle',
+                args=[{
+                    'x': [x[index:turn] for x in turn_numbers],
+                    'y': [y[index:turn] for y in scores],
+                    'customdata': [custom[index:turn] for custom in details]
+                }]
+            )
+        
+        all_turns_step = dict(
+            label='All',
+            method='restyle',
+            args=[{'x': turn_numbers, 'y': scores, 'customdata': details}]
         )
         
-        fig.update_traces(marker=dict(size=12))
-        fig.update_layout(height=600)
+        fig.update_layout(
+            title=f"Performance Timeline: {metric.replace('_', ' ').title()}",
+            xaxis=dict(title='Turn', range=[0.5, max_turns + 0.5]),
+            yaxis=dict(title='Score', range=[0, 10]),
+            legend=dict(title='Model'),
+            template=self.theme,
+            height=600,
+            sliders=[dict(
+                active=0,
+                currentvalue=dict(prefix='Turn: '),
+                pad=dict(b=10, t=60),
+                steps=[all_turns_step] + [turn_step(turn) for turn in range(1, max_turns + 1)]
+            )]
+        )
         
         return fig
     
@@ -177,31 +291,25 @@ class InteractiveCharts:
         Returns:
             Plotly figure object
         """
-        import scipy.cluster.hierarchy as sch
-        from scipy.spatial.distance import pdist, squareform
-        
         # Convert to matrix
         models = list(results.keys())
-        scenarios = list(list(results.values())[0].keys())
-        
-        matrix = np.array([[results[model][scenario] for scenario in scenarios] 
-                          for model in models])
+        scenarios = list(next(iter(results.values())))
         
-        # Perform hierarchical clustering
-        distances = pdist(matrix, metric='euclidean')
-        linkage = sch.linkage(distances, method='ward')
-        dendogram = sch.dendrogram(linkage, no_plot=True)
+        matrix = (
+            pd.DataFrame.from_dict(results, orient='index')
+            .reindex(index=models, columns=scenarios)
+            .fillna(0)
+            .to_numpy(dtype=np.float64)
+        )
         
-        # Reorder based on clustering
-        order = dendogram['leaves']
-        matrix_ordered = matrix[order]
-        models_ordered = [models[i] for i in order]
+        # Perform hierarchical clustering (cached on the matrix contents)
+        order = list(_cluster_leaf_order(matrix.tobytes(), matrix.shape))
         
-        # Create heatmap
+        # Create heatmap; rows are reordered by the y axis rather than by copying the matrix
         fig = go.Figure(data=go.Heatmap(
-            z=matrix_ordered,
+            z=matrix,
             x=scenarios,
-            y=models_ordered,
+            y=models,
             colorscale='Viridis',
             hovertemplate='Model: %{y}<br>Scenario: %{x}<br>Score: %{z:.2f}<extra></extra>'
         ))
@@ -213,48 +321,42 @@ class InteractiveCharts:
             template=self.theme,
             height=600
         )
+        fig.update_yaxes(categoryorder='array', categoryarray=[models[i] for i in order])
         
         return fig
     
     def sunburst_performance_breakdown(
         self,
-        results: Dict[str, Dict[str, Any]]
+        results: Dict[str, Dict[str, Any]],
+        table: Optional[ScoreTable] = None
     ) -> go.Figure:
         """
         Create a sunburst chart showing hierarchical performance breakdown.
         
         Args:
             results: Nested dictionary of performance metrics
+            table: Optional ScoreTable already built from results
             
         Returns:
             Plotly figure object
         """
-        # Prepare data for sunburst
-        labels = []
-        parents = []
-        values = []
-        colors = []
-        
-        # Root
-        labels.append("Overall")
-        parents.append("")
-        values.append(100)
-        colors.append("#636EFA")
-        
-        # Add models
-        for i, (model, metrics) in enumerate(results.items()):
-            labels.append(model)
-            parents.append("Overall")
-            model_avg = np.mean(list(metrics.values()))
-            values.append(model_avg * 10)  # Scale to percentage
-            colors.append(self.color_palette[i % len(self.color_palette)])
-            
-            # Add metrics for each model
-            for metric, score in metrics.items():
-                labels.append(f"{model} - {metric}")
-                parents.append(model)
-                values.append(score)
-                colors.append(self.color_palette[i % len(self.color_palette)])
+        # Prepare data for sunburst: root, then one node per model, then its metrics
+        table = table or ScoreTable.from_results(results)
+        models = table.models
+        model_colors = self._colors(len(models))
+        model_avgs = np.nanmean(table.matrix, axis=1) * 10  # Scale to percentage
+        
+        # Metric leaves in model-major order, skipping metrics a model does not report;
+        # each tier is built as a whole array rather than appended node by node
+        rows, cols = np.nonzero(~np.isnan(table.matrix))
+        model_names = np.asarray(models, dtype=str)
+        metric_names = np.asarray(table.metrics, dtype=str)
+        leaf_labels = np.char.add(np.char.add(model_names[rows], " - "), metric_names[cols])
+        
+        labels = np.concatenate([["Overall"], model_names, leaf_labels])
+        parents = np.concatenate([[""], np.full(len(models), "Overall"), model_names[rows]])
+        values = np.concatenate([[100], model_avgs, table.matrix[rows, cols]])
+        colors = np.concatenate([["#636EFA"], model_colors, np.take(model_colors, rows)])
         
         fig = go.Figure(go.Sunburst(
             labels=labels,
@@ -274,49 +376,53 @@ class InteractiveCharts:
     
     def parallel_coordinates_comparison(
         self,
-        results: Dict[str, Dict[str, float]]
+        results: Dict[str, Dict[str, float]],
+        table: Optional[ScoreTable] = None
     ) -> go.Figure:
         """
         Create a parallel coordinates plot for multi-dimensional comparison.
         
         Args:
             results: Dictionary mapping models to evaluation scores
+            table: Optional ScoreTable already built from results
             
         Returns:
             Plotly figure object
         """
-        # Prepare data
-        data = []
-        for model, scores in results.items():
-            row = {'Model': model}
-            row.update(scores)
-            data.append(row)
-        
-        df = pd.DataFrame(data)
+        # Prepare a (models x metrics) array; metrics missing for a model are NaN
+        table = table or ScoreTable.from_results(results)
+        metrics = table.metrics
+        scores_matrix = table.matrix
         
         # Create dimensions for parallel coordinates
-        dimensions = []
-        for col in df.columns[1:]:  # Skip 'Model' column
-            dimensions.append(
-                dict(
-                    range=[0, 10],
-                    label=col.replace('_', ' ').title(),
-                    values=df[col]
-                )
+        dimensions = [
+            dict(
+                range=[0, 10],
+                label=metric.replace('_', ' ').title(),
+                values=scores_matrix[:, j]
             )
+            for j, metric in enumerate(metrics)
+        ]
         
-        # Create color scale based on overall performance
-        overall_scores = df.iloc[:, 1:].mean(axis=1)
+        # Colour lines by whole-point average score bucket, so each line maps
+        # straight onto one of ten colorscale stops
+        overall_scores = np.nanmean(scores_matrix, axis=1)
+        score_buckets = np.clip(np.nan_to_num(overall_scores), 0, 9).astype(np.int32)
         
         fig = go.Figure(data=
             go.Parcoords(
                 line=dict(
-                    color=overall_scores,
-                    colorscale='Viridis',
+                    color=score_buckets,
+                    colorscale=SCORE_BUCKET_COLORSCALE,
                     showscale=True,
                     cmin=0,
-                    cmax=10,
-                    colorbar=dict(title="Avg Score")
+                    cmax=9,
+                    # Bucket b covers averages in [b, b + 1); a perfect 10 falls in the last one
+                    colorbar=dict(
+                        title="Avg Score bucket",
+                        tickvals=list(range(10)),
+                        ticktext=[f"{bucket}–{bucket + 1}" for bucket in range(10)]
+                    )
                 ),
                 dimensions=dimensions,
                 labelfont=dict(size=12),
@@ -345,31 +451,32 @@ class InteractiveCharts:
         Returns:
             Plotly figure object
         """
-        fig = go.Figure()
-        
-        for i, (scenario, scores) in enumerate(scenario_results.items()):
-            # Extract scores for different models
-            model_scores = {}
+        # Gather each model's scores across all scenarios in one pass
+        model_x = defaultdict(list)
+        model_y = defaultdict(list)
+        for scenario, scores in scenario_results.items():
             for score_dict in scores:
                 for model, score in score_dict.items():
-                    if model not in model_scores:
-                        model_scores[model] = []
-                    model_scores[model].append(score)
-            
-            # Add box plot for each model in this scenario
-            for j, (model, model_score_list) in enumerate(model_scores.items()):
-                fig.add_trace(go.Box(
-                    y=model_score_list,
-                    name=f"{scenario} - {model}",
-                    boxpoints='all',
-                    jitter=0.3,
-                    pointpos=-1.8,
-                    marker_color=self.color_palette[(i + j) % len(self.color_palette)]
-                ))
+                    model_x[model].append(scenario)
+                    model_y[model].append(score)
+        
+        # One box trace per model; plotly groups its boxes by scenario along x
+        fig = go.Figure()
+        for model, color in zip(model_y, self._colors(len(model_y))):
+            fig.add_trace(go.Box(
+                x=model_x[model],
+                y=model_y[model],
+                name=model,
+                boxpoints='all',
+                jitter=0.3,
+                pointpos=-1.8,
+                marker_color=color
+            ))
         
         fig.update_layout(
             title="Score Distribution by Scenario and Model",
             yaxis_title="Score",
+            boxmode='group',
             showlegend=True,
             template=self.theme,
             height=600
@@ -377,6 +484,18 @@ class InteractiveCharts:
         
         return fig
     
+    def serialize(self, charts: Dict[str, go.Figure]) -> Dict[str, str]:
+        """
+        Serialize a set of figures to JSON strings for a web frontend.
+        
+        Args:
+            charts: Dictionary of chart names to Plotly figures
+            
+        Returns:
+            Dictionary of chart names to JSON strings
+        """
+        return {name: figure_to_json(fig) for name, fig in charts.items()}
+    
     def create_comparison_dashboard(
         self,
         results: Dict[str, Any]
@@ -397,18 +516,24 @@ class InteractiveCharts:
         scenario_scores = {}
         
         for model, model_data in results.items():
-            if 'evaluator_scores' in model_data.get('overall', {}):
-                evaluator_scores[model] = model_data['overall']['evaluator_scores']
+            overall = model_data.get('overall') or {}
+            
+            model_evaluator_scores = overall.get('evaluator_scores')
+            if model_evaluator_scores is not None:
+                evaluator_scores[model] = model_evaluator_scores
             
-            if 'scenario_scores' in model_data.get('overall', {}):
-                scenario_scores[model] = model_data['overall']['scenario_scores']
+            model_scenario_scores = overall.get('scenario_scores')
+            if model_scenario_scores is not None:
+                scenario_scores[model] = model_scenario_scores
         
         # Generate all chart types
         if evaluator_scores:
-            charts['radar'] = self.interactive_radar_chart(evaluator_scores)
-            charts['3d_scatter'] = self.model_comparison_3d_scatter(evaluator_scores)
-            charts['parallel'] = self.parallel_coordinates_comparison(evaluator_scores)
-            charts['sunburst'] = self.sunburst_performance_breakdown(evaluator_scores)
+            # Flatten the evaluator scores once and share them across the charts
+            table = ScoreTable.from_results(evaluator_scores)
+            charts['radar'] = self.interactive_radar_chart(evaluator_scores, table=table)
+            charts['3d_scatter'] = self.model_comparison_3d_scatter(evaluator_scores, table=table)
+            charts['parallel'] = self.parallel_coordinates_comparison(evaluator_scores, table=table)
+            charts['sunburst'] = self.sunburst_performance_breakdown(evaluator_scores, table=table)
         
         if scenario_scores:
             charts['heatmap'] = self.interactive_heatmap_with_dendogram(scenario_scores)
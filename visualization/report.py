@@ -2,61 +2,56 @@
 """
 Report generation functions for benchmark results.
 """
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
+import functools
 import json
 import os
 import io
 import datetime
-import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import jinja2
-import pdfkit
-import markdown
+from markupsafe import Markup, escape
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
 
 from .charts import (
+    STYLE_LOCK,
     model_comparison_radar,
     scenario_comparison_heatmap,
     tool_usage_bar_chart,
     performance_trend_line,
     breakdown_stacked_bar,
-    success_rate_chart
+    success_rate_chart,
+    set_plotting_style
 )
 
+# Write buffer for the HTML report, which is streamed to disk in many small chunks
+OUTPUT_BUFFER_SIZE = 1 << 20
 
-class BenchmarkReport:
-    """Generator for benchmark reports in HTML and PDF formats."""
-    
-    def __init__(self, results: Dict[str, Any], output_dir: str = None): #type: ignore
-        """
-        Initialize the report generator.
-        
-        Args:
-            results: Dictionary of benchmark results
-            output_dir: Directory to save generated reports
-        """
-        self.results = results
-        self.output_dir = Path(output_dir) if output_dir else Path.cwd() / 'reports'
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Set up Jinja2 environment
-        self.template_dir = Path(os.path.dirname(os.path.abspath(__file__))) / 'templates'
-        self.template_dir.mkdir(exist_ok=True)
-        
-        self.jinja_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(self.template_dir)),
-            autoescape=jinja2.select_autoescape(['html', 'xml'])
-        )
-        
-        # Create template files if they don't exist
-        self._create_template_files()
-    
-    def _create_template_files(self):
-        """Create HTML template files for reports."""
-        # Create report HTML template
-        report_html = """
+# Shared read-only fallback for missing sub-dicts, so lookups allocate nothing on a miss
+_EMPTY: Dict[str, Any] = {}
+
+# Report chart name -> drawing function, in the order the charts are prepared
+REPORT_CHARTS = {
+    'radar': model_comparison_radar,
+    'heatmap': scenario_comparison_heatmap,
+    'tool_usage': tool_usage_bar_chart,
+    'breakdown': breakdown_stacked_bar,
+    'success_rate': success_rate_chart,
+    'trends': performance_trend_line,
+}
+
+
+# HTML report template, written to templates/report.html for the Jinja2 loader
+REPORT_TEMPLATE = """
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -95,7 +90,7 @@ class BenchmarkReport:
                     margin: 30px 0;
                     text-align: center;
                 }
-                .chart-image {
+                .chart-image svg {
                     max-width: 100%;
                     height: auto;
                 }
@@ -183,7 +178,7 @@ class BenchmarkReport:
                 
                 <div class="chart-container">
                     <h3>Model Performance by Evaluator Category</h3>
-                    <img class="chart-image" src="{{ charts.radar }}" alt="Radar chart of model performance">
+                    <div class="chart-image" role="img" aria-label="Radar chart of model performance">{{ charts.radar|safe }}</div>
                 </div>
                 
                 <div class="model-comparison">
@@ -195,7 +190,7 @@ class BenchmarkReport:
                         <h4>Breakdown:</h4>
                         <ul>
                             {% for category, score in scores[model].categories.items() %}
-                            <li>{{ category|replace('_', ' ')|title }}: <span class="score {{ score_class(score) }}">{{ score }}</span>/10</li>
+                            <li>{{ category_titles[category] }}: <span class="score {{ score_class(score) }}">{{ score }}</span>/10</li>
                             {% endfor %}
                         </ul>
                     </div>
@@ -207,7 +202,7 @@ class BenchmarkReport:
                 <h2>Performance by Scenario</h2>
                 
                 <div class="chart-container">
-                    <img class="chart-image" src="{{ charts.heatmap }}" alt="Heatmap of scenario performance">
+                    <div class="chart-image" role="img" aria-label="Heatmap of scenario performance">{{ charts.heatmap|safe }}</div>
                 </div>
                 
                 <table>
@@ -222,7 +217,7 @@ class BenchmarkReport:
                     <tbody>
                         {% for scenario in scenarios %}
                         <tr>
-                            <td>{{ scenario|replace('_', ' ')|title }}</td>
+                            <td>{{ scenario_titles[scenario] }}</td>
                             {% for model in models %}
                             <td class="{{ score_class(scenario_scores[model][scenario]) }}">{{ scenario_scores[model][scenario] }}</td>
                             {% endfor %}
@@ -236,7 +231,7 @@ class BenchmarkReport:
                 <h2>Tool Usage Analysis</h2>
                 
                 <div class="chart-container">
-                    <img class="chart-image" src="{{ charts.tool_usage }}" alt="Tool usage performance">
+                    <div class="chart-image" role="img" aria-label="Tool usage performance">{{ charts.tool_usage|safe }}</div>
                 </div>
                 
                 <h3>Key Observations</h3>
@@ -252,17 +247,17 @@ class BenchmarkReport:
                 
                 <div class="chart-container">
                     <h3>Score Breakdown by Category</h3>
-                    <img class="chart-image" src="{{ charts.breakdown }}" alt="Score breakdown">
+                    <div class="chart-image" role="img" aria-label="Score breakdown">{{ charts.breakdown|safe }}</div>
                 </div>
                 
                 <div class="chart-container">
                     <h3>Performance Trends Across Conversation</h3>
-                    <img class="chart-image" src="{{ charts.trends }}" alt="Performance trends">
+                    <div class="chart-image" role="img" aria-label="Performance trends">{{ charts.trends|safe }}</div>
                 </div>
                 
                 <div class="chart-container">
                     <h3>Success Rates by Category</h3>
-                    <img class="chart-image" src="{{ charts.success_rate }}" alt="Success rates">
+                    <div class="chart-image" role="img" aria-label="Success rates">{{ charts.success_rate|safe }}</div>
                 </div>
             </div>
             
@@ -282,311 +277,333 @@ class BenchmarkReport:
         </body>
         </html>
         """
+
+
+
+@functools.lru_cache(maxsize=None)
+def _pretty(name: str) -> str:
+    """Display form of a snake_case name; the same few names recur throughout a report."""
+    return name.replace('_', ' ').title()
+
+
+def _display_titles(names) -> Dict[str, Markup]:
+    """Map snake_case names to escaped display titles, so templates skip per-cell filters."""
+    return {name: escape(_pretty(name)) for name in names}
+
+
+def _ranked_phrase(ranked: List[tuple], noun: str = '') -> str:
+    """Join (name, average) pairs into "A scenarios (avg. score: 8.0/10) and B ..." text."""
+    return ' and '.join(
+        f"{_pretty(name)}{noun} (avg. score: {score:.1f}/10)" for name, score in ranked
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _score_class(score: float) -> str:
+    """CSS class for a score cell; scores repeat heavily, so results are memoized."""
+    return 'good-score' if score >= 7 else 'medium-score' if score >= 4 else 'poor-score'
+
+
+def _fig_to_svg(fig, dpi: int = 100) -> str:
+    """Render a figure as SVG markup for inlining into the HTML report.
+    
+    dpi only sets the resolution of raster content such as the heatmap image.
+    """
+    svg_data = io.StringIO()
+    fig.savefig(svg_data, format='svg', bbox_inches='tight', dpi=dpi)
+    svg = svg_data.getvalue()
+    # Drop the XML prolog and doctype, which are not valid inside an HTML body
+    return svg[svg.find('<svg'):]
+
+class BenchmarkReport:
+    """Generator for benchmark reports in HTML and PDF formats."""
+    
+    # Compiled report template, shared by all instances once first loaded
+    _template: Optional[jinja2.Template] = None
+    
+    def __init__(self, results: Dict[str, Any], output_dir: str = None, chart_dpi: Optional[int] = None): #type: ignore
+        """
+        Initialize the report generator.
         
-        with open(self.template_dir / 'report.html', 'w', encoding='utf-8') as f:
-            f.write(report_html)
+        Args:
+            results: Dictionary of benchmark results
+            output_dir: Directory to save generated reports
+            chart_dpi: Resolution for raster chart content (default: BIZCON_CHART_DPI or 100)
+        """
+        self.results = results
+        self.output_dir = Path(output_dir) if output_dir else Path.cwd() / 'reports'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.chart_dpi = chart_dpi or int(os.environ.get('BIZCON_CHART_DPI', 100))
+        
+        # Set up Jinja2 environment
+        self.template_dir = Path(os.path.dirname(os.path.abspath(__file__))) / 'templates'
+        self.template_dir.mkdir(exist_ok=True)
+        
+        # The template only changes with this module, so skip mtime checks on lookup;
+        # compiled bytecode is cached in the system temp directory across processes
+        self.jinja_env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(self.template_dir)),
+            autoescape=jinja2.select_autoescape(['html', 'xml']),
+            auto_reload=False,
+            cache_size=-1,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            bytecode_cache=jinja2.FileSystemBytecodeCache()
+        )
+        
+        # Create template files if they don't exist
+        self._create_template_files()
+        
+        self._html_lock = threading.Lock()
+    
+    def _create_template_files(self):
+        """Write the report HTML template, skipping the write when it is already current."""
+        template_path = self.template_dir / 'report.html'
+        if template_path.exists() and template_path.read_text(encoding='utf-8') == REPORT_TEMPLATE:
+            return
+        template_path.write_text(REPORT_TEMPLATE, encoding='utf-8')
+    
+    @functools.cached_property
+    def charts(self) -> Dict[str, str]:
+        """Rendered chart markup, generated on first access and reused afterwards."""
+        return self._generate_charts()
+    
+    def _render_chart(self, chart_name: str, data: Dict[str, Dict[str, Any]]) -> str:
+        """Draw one chart on its own figure and return it as inline SVG markup."""
+        from matplotlib.figure import Figure
+        
+        # Style is applied through global rcParams, so only drawing is serialized;
+        # SVG export in _fig_to_svg runs concurrently.
+        with STYLE_LOCK:
+            set_plotting_style()
+            fig = Figure()
+            ax = fig.add_subplot(111, polar=(chart_name == 'radar'))
+            REPORT_CHARTS[chart_name](data, ax=ax)
+        
+        return _fig_to_svg(fig, dpi=self.chart_dpi)
     
     def _generate_charts(self) -> Dict[str, str]:
         """
-        Generate charts and convert them to base64 for embedding in reports.
+        Generate charts as SVG markup for embedding in reports.
         
         Returns:
-            Dictionary mapping chart names to base64-encoded images
+            Dictionary mapping chart names to inline SVG strings
         """
-        charts = {}
-        
-        # Prepare data for radar chart
+        # Prepare the data for every chart in one pass, looking up each model's sub-dicts once
         evaluator_scores = {}
-        for model, model_data in self.results.items():
-            evaluator_scores[model] = {}
-            for evaluator, score in model_data.get('overall', {}).get('evaluator_scores', {}).items():
-                evaluator_scores[model][evaluator] = score
-        
-        # Generate radar chart
-        fig = model_comparison_radar(evaluator_scores)
-        img_data = io.BytesIO()
-        fig.savefig(img_data, format='png', bbox_inches='tight', dpi=150)
-        img_data.seek(0)
-        plt.close(fig)
-        charts['radar'] = base64.b64encode(img_data.getvalue()).decode('utf-8')
-        
-        # Prepare data for heatmap
         scenario_scores = {}
-        for model, model_data in self.results.items():
-            scenario_scores[model] = {}
-            for run in model_data.get('runs', []):
-                scenario_name = run.get('scenario', {}).get('name', '')
-                scenario_scores[model][scenario_name] = run.get('overall_score', 0)
-        
-        # Generate heatmap
-        fig = scenario_comparison_heatmap(scenario_scores)
-        img_data = io.BytesIO()
-        fig.savefig(img_data, format='png', bbox_inches='tight', dpi=150)
-        img_data.seek(0)
-        plt.close(fig)
-        charts['heatmap'] = base64.b64encode(img_data.getvalue()).decode('utf-8')
-        
-        # Prepare data for tool usage chart
         tool_metrics = {}
-        for model, model_data in self.results.items():
-            tool_metrics[model] = {}
-            for metric, score in model_data.get('overall', {}).get('tool_usage', {}).items():
-                tool_metrics[model][metric] = score
-        
-        # Generate tool usage chart
-        fig = tool_usage_bar_chart(tool_metrics)
-        img_data = io.BytesIO()
-        fig.savefig(img_data, format='png', bbox_inches='tight', dpi=150)
-        img_data.seek(0)
-        plt.close(fig)
-        charts['tool_usage'] = base64.b64encode(img_data.getvalue()).decode('utf-8')
-        
-        # Prepare data for breakdown chart
         breakdown = {}
-        for model, model_data in self.results.items():
-            breakdown[model] = {}
-            for category, score in model_data.get('overall', {}).get('category_scores', {}).items():
-                breakdown[model][category] = score
-        
-        # Generate breakdown chart
-        fig = breakdown_stacked_bar(breakdown)
-        img_data = io.BytesIO()
-        fig.savefig(img_data, format='png', bbox_inches='tight', dpi=150)
-        img_data.seek(0)
-        plt.close(fig)
-        charts['breakdown'] = base64.b64encode(img_data.getvalue()).decode('utf-8')
-        
-        # Prepare data for success rate chart
         success_rates = {}
-        for model, model_data in self.results.items():
-            success_rates[model] = {}
-            for category, rate in model_data.get('overall', {}).get('success_rates', {}).items():
-                success_rates[model][category] = rate
-        
-        # Generate success rate chart
-        fig = success_rate_chart(success_rates)
-        img_data = io.BytesIO()
-        fig.savefig(img_data, format='png', bbox_inches='tight', dpi=150)
-        img_data.seek(0)
-        plt.close(fig)
-        charts['success_rate'] = base64.b64encode(img_data.getvalue()).decode('utf-8')
-        
-        # Prepare data for performance trend line
         turn_scores = {}
         for model, model_data in self.results.items():
-            scores = []
-            for run in model_data.get('runs', []):
-                for turn in run.get('turns', []):
-                    scores.append(turn.get('score', 0))
+            overall = model_data.get('overall') or _EMPTY
+            evaluator_scores[model] = dict(overall.get('evaluator_scores') or _EMPTY)
+            tool_metrics[model] = dict(overall.get('tool_usage') or _EMPTY)
+            breakdown[model] = dict(overall.get('category_scores') or _EMPTY)
+            success_rates[model] = dict(overall.get('success_rates') or _EMPTY)
+            
+            runs = model_data.get('runs') or ()
+            scenario_scores[model] = {
+                (run.get('scenario') or _EMPTY).get('name', ''): run.get('overall_score', 0)
+                for run in runs
+            }
+            scores = [turn.get('score', 0) for run in runs for turn in run.get('turns') or ()]
             if scores:
                 turn_scores[model] = scores
         
-        # Generate performance trend line
-        fig = performance_trend_line(turn_scores)
-        img_data = io.BytesIO()
-        fig.savefig(img_data, format='png', bbox_inches='tight', dpi=150)
-        img_data.seek(0)
-        plt.close(fig)
-        charts['trends'] = base64.b64encode(img_data.getvalue()).decode('utf-8')
-        
-        # Convert to data URLs
-        for chart_name, img_base64 in charts.items():
-            charts[chart_name] = f'data:image/png;base64,{img_base64}'
+        chart_data = {
+            'radar': evaluator_scores,
+            'heatmap': scenario_scores,
+            'tool_usage': tool_metrics,
+            'breakdown': breakdown,
+            'success_rate': success_rates,
+            'trends': turn_scores,
+        }
         
-        return charts
+        # The charts are independent, so render them in parallel
+        with ThreadPoolExecutor(max_workers=len(chart_data)) as executor:
+            futures = {
+                chart_name: executor.submit(self._render_chart, chart_name, data)
+                for chart_name, data in chart_data.items()
+            }
+            return {chart_name: future.result() for chart_name, future in futures.items()}
     
-    def _prepare_template_data(self) -> Dict[str, Any]:
+    def _aggregate_results(self) -> Dict[str, Any]:
         """
-        Prepare data for the report template.
+        Collect per-model scores and cross-model averages in a single pass.
         
         Returns:
-            Dictionary of template variables
+            Dictionary with models, scenarios, scores and scenario_scores, the
+            scenario/category score matrices, the overall score Series,
+            scenario/category column means, the tool metric matrix,
+            all_categorized and top_model
         """
-        # Get basic metadata
         models = list(self.results.keys())
-        
-        # Get list of scenarios
-        scenarios = set()
-        for model_data in self.results.values():
-            for run in model_data.get('runs', []):
-                scenario_name = run.get('scenario', {}).get('name', '')
-                if scenario_name:
-                    scenarios.add(scenario_name)
-        scenarios = list(scenarios)
-        
-        # Get scores for each model
         scores = {}
+        scenario_scores = {}
+        tool_metrics = {}
         for model, model_data in self.results.items():
-            overall_score = model_data.get('overall', {}).get('score', 0)
-            category_scores = model_data.get('overall', {}).get('category_scores', {})
+            overall = model_data.get('overall') or _EMPTY
             scores[model] = {
-                'overall': overall_score,
-                'categories': category_scores
+                'overall': overall.get('score', 0),
+                'categories': overall.get('category_scores', {})
+            }
+            tool_metrics[model] = overall.get('tool_usage') or _EMPTY
+            # A scenario run more than once keeps its last score
+            scenario_scores[model] = {
+                scenario_name: run.get('overall_score', 0)
+                for run in model_data.get('runs') or ()
+                if (scenario_name := (run.get('scenario') or _EMPTY).get('name', ''))
             }
         
-        # Find top model
-        top_model = None
-        top_model_score = 0
-        for model, model_scores in scores.items():
-            if model_scores['overall'] > top_model_score:
-                top_model = model
-                top_model_score = model_scores['overall']
+        # models x scenarios/categories/tool metrics; NaN marks a missing score and is skipped by mean()
+        overall_scores = pd.Series([scores[model]['overall'] for model in models], index=models, dtype=float)
+        scenario_matrix = pd.DataFrame.from_dict(scenario_scores, orient='index', dtype=float).reindex(models)
+        category_matrix = pd.DataFrame.from_dict(
+            {model: model_scores['categories'] for model, model_scores in scores.items()},
+            orient='index', dtype=float
+        ).reindex(models)
+        tool_matrix = pd.DataFrame.from_dict(tool_metrics, orient='index', dtype=float).reindex(models)
         
-        # Get scenario scores
-        scenario_scores = {}
-        for model, model_data in self.results.items():
-            scenario_scores[model] = {}
-            for run in model_data.get('runs', []):
-                scenario_name = run.get('scenario', {}).get('name', '')
-                if scenario_name:
-                    scenario_scores[model][scenario_name] = run.get('overall_score', 0)
+        top_model = overall_scores.idxmax() if models and overall_scores.max() > 0 else None
         
-        # Generate charts
-        charts = self._generate_charts()
+        return {
+            'models': models,
+            'scenarios': list(scenario_matrix.columns),
+            'scores': scores,
+            'scenario_scores': scenario_scores,
+            'scenario_matrix': scenario_matrix,
+            'category_matrix': category_matrix,
+            'overall_scores': overall_scores,
+            'scenario_avgs': scenario_matrix.mean(axis=0),
+            'category_avgs': category_matrix.mean(axis=0),
+            'all_categorized': all(model_scores['categories'] for model_scores in scores.values()),
+            'tool_matrix': tool_matrix,
+            'top_model': top_model
+        }
+    
+    def _prepare_template_data(self, include_charts: bool = True) -> Dict[str, Any]:
+        """
+        Prepare data for the report template.
+        
+        Args:
+            include_charts: Whether to render the charts (only the HTML report embeds them)
+            
+        Returns:
+            Dictionary of template variables
+        """
+        if include_charts:
+            return {**self._template_data, 'charts': self.charts}
+        return self._template_data
+    
+    @functools.cached_property
+    def _template_data(self) -> Dict[str, Any]:
+        """Chart-free template variables, computed once and shared by every output format."""
+        # Aggregate scores in one pass over the results
+        aggregates = self._aggregate_results()
+        models = aggregates['models']
+        scenarios = aggregates['scenarios']
+        scores = aggregates['scores']
+        scenario_scores = aggregates['scenario_scores']
+        top_model = aggregates['top_model']
+        top_model_score = scores[top_model]['overall'] if top_model else 0
         
         # Generate summary and recommendations based on results
-        summary = self._generate_summary(models, scores, scenario_scores)
-        key_findings = self._generate_key_findings(models, scores, scenario_scores)
-        recommendations = self._generate_recommendations(models, scores, scenario_scores)
-        tool_observations = self._generate_tool_observations(models, self.results)
+        summary = self._generate_summary(aggregates)
+        key_findings = self._generate_key_findings(aggregates)
+        recommendations = self._generate_recommendations(aggregates)
+        tool_observations = self._generate_tool_observations(aggregates)
         
-        # Return template data
+        # Return template data; one clock read keeps the timestamp and year consistent
+        now = datetime.datetime.now()
         return {
             'title': 'bizCon Benchmark Report',
-            'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'current_year': datetime.datetime.now().year,
+            'timestamp': now.strftime('%Y-%m-%d %H:%M:%S'),
+            'current_year': now.year,
             'models': models,
             'scenarios': scenarios,
             'scores': scores,
             'top_model': top_model,
             'top_model_score': f"{top_model_score:.1f}",
             'scenario_scores': scenario_scores,
-            'charts': charts,
+            'scenario_matrix': aggregates['scenario_matrix'],
+            'category_matrix': aggregates['category_matrix'],
+            'scenario_titles': _display_titles(scenarios),
+            'category_titles': _display_titles(aggregates['category_avgs'].index),
+            'charts': {},
             'summary': summary,
             'key_findings': key_findings,
             'recommendations': recommendations,
             'tool_observations': tool_observations,
-            'score_class': lambda score: 'good-score' if score >= 7 else 'medium-score' if score >= 4 else 'poor-score'
+            'score_class': _score_class
         }
     
-    def _generate_summary(self, 
-                         models: List[str], 
-                         scores: Dict[str, Dict[str, float]], 
-                         scenario_scores: Dict[str, Dict[str, float]]) -> str:
+    def _generate_summary(self, aggregates: Dict[str, Any]) -> str:
         """Generate summary text based on benchmark results."""
-        n_models = len(models)
-        avg_overall = sum(s['overall'] for s in scores.values()) / n_models if n_models > 0 else 0
+        overall_scores = aggregates['overall_scores']
+        n_models = len(overall_scores)
+        avg_overall = overall_scores.mean() if n_models > 0 else 0
         
-        summary = f"This report presents a comprehensive evaluation of {n_models} language models on business conversation tasks. "
+        parts = [f"This report presents a comprehensive evaluation of {n_models} language models on business conversation tasks. "]
         
         if n_models > 1:
-            model_performances = [(model, scores[model]['overall']) for model in models]
-            model_performances.sort(key=lambda x: x[1], reverse=True)
-            best_model, best_score = model_performances[0]
-            worst_model, worst_score = model_performances[-1]
+            # Ties go to the first-listed model for best and the last-listed one for worst
+            best_model = overall_scores.idxmax()
+            worst_model = overall_scores[::-1].idxmin()
+            best_score = overall_scores[best_model]
+            worst_score = overall_scores[worst_model]
             
             if best_score - worst_score > 3:
-                summary += f"There is significant variation in model performance, with {best_model} ({best_score:.1f}/10) substantially outperforming {worst_model} ({worst_score:.1f}/10). "
+                parts.append(f"There is significant variation in model performance, with {best_model} ({best_score:.1f}/10) substantially outperforming {worst_model} ({worst_score:.1f}/10). ")
             elif best_score - worst_score > 1:
-                summary += f"There are notable differences between models, with {best_model} ({best_score:.1f}/10) outperforming {worst_model} ({worst_score:.1f}/10). "
+                parts.append(f"There are notable differences between models, with {best_model} ({best_score:.1f}/10) outperforming {worst_model} ({worst_score:.1f}/10). ")
             else:
-                summary += f"All models performed similarly, with overall scores ranging from {worst_score:.1f} to {best_score:.1f}. "
+                parts.append(f"All models performed similarly, with overall scores ranging from {worst_score:.1f} to {best_score:.1f}. ")
         
         # Comment on overall performance
         if avg_overall >= 8:
-            summary += "Overall, the models demonstrated excellent performance on business conversation tasks. "
+            level = "excellent"
         elif avg_overall >= 6:
-            summary += "Overall, the models demonstrated good performance on business conversation tasks. "
+            level = "good"
         elif avg_overall >= 4:
-            summary += "Overall, the models demonstrated adequate performance on business conversation tasks. "
+            level = "adequate"
         else:
-            summary += "Overall, the models demonstrated poor performance on business conversation tasks. "
+            level = "poor"
+        parts.append(f"Overall, the models demonstrated {level} performance on business conversation tasks. ")
         
-        return summary
+        return ''.join(parts)
     
-    def _generate_key_findings(self, 
-                              models: List[str], 
-                              scores: Dict[str, Dict[str, float]], 
-                              scenario_scores: Dict[str, Dict[str, float]]) -> List[str]:
+    def _generate_key_findings(self, aggregates: Dict[str, Any]) -> List[str]:
         """Generate key findings based on benchmark results."""
         findings = []
         
         # Finding 1: Best and worst scenarios
-        all_scenario_scores = []
-        for model, scenarios in scenario_scores.items():
-            for scenario, score in scenarios.items():
-                all_scenario_scores.append((model, scenario, score))
-        
-        if all_scenario_scores:
-            # Best scenario types
-            scenario_avg_scores = {}
-            for _, scenario, score in all_scenario_scores:
-                if scenario not in scenario_avg_scores:
-                    scenario_avg_scores[scenario] = []
-                scenario_avg_scores[scenario].append(score)
-            
-            for scenario, scores_list in scenario_avg_scores.items():
-                scenario_avg_scores[scenario] = sum(scores_list) / len(scores_list)
-            
-            best_scenarios = sorted(scenario_avg_scores.items(), key=lambda x: x[1], reverse=True)[:2]
-            worst_scenarios = sorted(scenario_avg_scores.items(), key=lambda x: x[1])[:2]
-            
-            findings.append(f"Models performed best on {best_scenarios[0][0].replace('_', ' ').title()} scenarios " +
-                           f"(avg. score: {best_scenarios[0][1]:.1f}/10)" +
-                           (f" and {best_scenarios[1][0].replace('_', ' ').title()} scenarios " +
-                           f"(avg. score: {best_scenarios[1][1]:.1f}/10)" if len(best_scenarios) > 1 else ""))
+        scenario_avg_scores = aggregates['scenario_avgs']
+        if not scenario_avg_scores.empty:
+            best_scenarios = list(scenario_avg_scores.nlargest(2).items())
+            worst_scenarios = list(scenario_avg_scores.nsmallest(2).items())
             
-            findings.append(f"Models struggled most with {worst_scenarios[0][0].replace('_', ' ').title()} scenarios " +
-                           f"(avg. score: {worst_scenarios[0][1]:.1f}/10)" +
-                           (f" and {worst_scenarios[1][0].replace('_', ' ').title()} scenarios " +
-                           f"(avg. score: {worst_scenarios[1][1]:.1f}/10)" if len(worst_scenarios) > 1 else ""))
+            findings.append(f"Models performed best on {_ranked_phrase(best_scenarios, ' scenarios')}")
+            findings.append(f"Models struggled most with {_ranked_phrase(worst_scenarios, ' scenarios')}")
         
         # Finding 2: Best and worst evaluator categories
-        if models and all(scores[model].get('categories') for model in models):
-            category_scores = {}
-            for model in models: 
-                for category, score in scores[model]['categories'].items(): #type: ignore
-                    if category not in category_scores:
-                        category_scores[category] = []
-                    category_scores[category].append(score)
+        if aggregates['models'] and aggregates['all_categorized']:
+            category_scores = aggregates['category_avgs']
             
-            for category, scores_list in category_scores.items():
-                category_scores[category] = sum(scores_list) / len(scores_list)
+            best_categories = list(category_scores.nlargest(2).items())
+            worst_categories = list(category_scores.nsmallest(2).items())
             
-            best_categories = sorted(category_scores.items(), key=lambda x: x[1], reverse=True)[:2]
-            worst_categories = sorted(category_scores.items(), key=lambda x: x[1])[:2]
-            
-            findings.append(f"Models scored highest in {best_categories[0][0].replace('_', ' ').title()} " +
-                           f"(avg. score: {best_categories[0][1]:.1f}/10)" +
-                           (f" and {best_categories[1][0].replace('_', ' ').title()} " +
-                           f"(avg. score: {best_categories[1][1]:.1f}/10)" if len(best_categories) > 1 else ""))
-            
-            findings.append(f"Models scored lowest in {worst_categories[0][0].replace('_', ' ').title()} " +
-                           f"(avg. score: {worst_categories[0][1]:.1f}/10)" +
-                           (f" and {worst_categories[1][0].replace('_', ' ').title()} " +
-                           f"(avg. score: {worst_categories[1][1]:.1f}/10)" if len(worst_categories) > 1 else ""))
+            findings.append(f"Models scored highest in {_ranked_phrase(best_categories)}")
+            findings.append(f"Models scored lowest in {_ranked_phrase(worst_categories)}")
         
         return findings
     
-    def _generate_recommendations(self, 
-                                models: List[str], 
-                                scores: Dict[str, Dict[str, float]], 
-                                scenario_scores: Dict[str, Dict[str, float]]) -> List[str]:
+    def _generate_recommendations(self, aggregates: Dict[str, Any]) -> List[str]:
         """Generate recommendations based on benchmark results."""
         recommendations = []
-        
-        # Get average scores by category
-        category_scores = {}
-        for model in models:
-            model_categories = scores[model].get('categories', {})
-            for category, score in model_categories.items(): #type: ignore
-                if category not in category_scores:
-                    category_scores[category] = []
-                category_scores[category].append(score)
-        
-        category_avgs = {}
-        for category, cat_scores in category_scores.items():
-            category_avgs[category] = sum(cat_scores) / len(cat_scores) if cat_scores else 0
+        models = aggregates['models']
+        category_avgs = aggregates['category_avgs']
         
         # Add category-specific recommendations
         for category, avg_score in category_avgs.items():
@@ -613,32 +630,19 @@ class BenchmarkReport:
         
         # Add general recommendations
         if len(models) > 1:
-            top_model = max(models, key=lambda m: scores[m]['overall'])
+            top_model = aggregates['overall_scores'].idxmax()
             recommendations.append(
                 f"Consider using {top_model} for critical business scenarios where overall "
                 f"performance is essential, as it demonstrated the highest overall scores."
             )
         
         # Add scenario-specific recommendations
-        all_scenario_scores = []
-        for model, scenarios in scenario_scores.items():
-            for scenario, score in scenarios.items():
-                all_scenario_scores.append((model, scenario, score))
-        
-        if all_scenario_scores:
-            scenario_avg_scores = {}
-            for _, scenario, score in all_scenario_scores:
-                if scenario not in scenario_avg_scores:
-                    scenario_avg_scores[scenario] = []
-                scenario_avg_scores[scenario].append(score)
-            
-            for scenario, score_list in scenario_avg_scores.items():
-                avg_score = sum(score_list) / len(score_list)
-                if avg_score < 5:
-                    recommendations.append(
-                        f"Develop specialized training data for {scenario.replace('_', ' ').title()} scenarios, "
-                        f"which showed lower performance across all models (avg. score: {avg_score:.1f}/10)."
-                    )
+        for scenario, avg_score in aggregates['scenario_avgs'].items():
+            if avg_score < 5:
+                recommendations.append(
+                    f"Develop specialized training data for {_pretty(scenario)} scenarios, "
+                    f"which showed lower performance across all models (avg. score: {avg_score:.1f}/10)."
+                )
         
         # Add a recommendation about benchmarking
         recommendations.append(
@@ -648,30 +652,17 @@ class BenchmarkReport:
         
         return recommendations
     
-    def _generate_tool_observations(self, 
-                                  models: List[str], 
-                                  results: Dict[str, Any]) -> List[str]:
+    def _generate_tool_observations(self, aggregates: Dict[str, Any]) -> List[str]:
         """Generate observations about tool usage based on benchmark results."""
         observations = []
         
-        # Extract tool usage metrics
-        tool_metrics = {}
-        for model, model_data in results.items():
-            tool_metrics[model] = model_data.get('overall', {}).get('tool_usage', {})
-        
-        if not tool_metrics or not any(tool_metrics.values()):
+        # Tool usage metrics as models x metrics, NaN where missing
+        tool_matrix = aggregates['tool_matrix']
+        if tool_matrix.columns.empty:
             return ["No tool usage data available for analysis."]
         
         # Calculate averages for each metric across models
-        metric_avgs = {}
-        for model, metrics in tool_metrics.items():
-            for metric, value in metrics.items():
-                if metric not in metric_avgs:
-                    metric_avgs[metric] = []
-                metric_avgs[metric].append(value)
-        
-        for metric, values in metric_avgs.items():
-            metric_avgs[metric] = sum(values) / len(values) if values else 0
+        metric_avgs = tool_matrix.mean(axis=0)
         
         # Generate observations based on the metrics
         if 'tool_selection' in metric_avgs:
@@ -703,20 +694,31 @@ class BenchmarkReport:
                 observations.append(f"Models struggled to properly interpret and incorporate tool results (avg. score: {avg_interpretation:.1f}/10).")
         
         # Compare models if there are multiple
-        if len(models) > 1:
-            best_model = None
-            best_score = 0
-            for model, metrics in tool_metrics.items():
-                tool_avg = sum(metrics.values()) / len(metrics) if metrics else 0
-                if tool_avg > best_score:
-                    best_score = tool_avg
-                    best_model = model
+        if len(tool_matrix) > 1:
+            model_avgs = tool_matrix.mean(axis=1).fillna(0)
+            best_model = model_avgs.idxmax() if model_avgs.max() > 0 else None
+            best_score = model_avgs.max()
             
             if best_model:
                 observations.append(f"{best_model} demonstrated the best overall tool usage capabilities (avg. score: {best_score:.1f}/10).")
         
         return observations
     
+    def _get_template(self) -> jinja2.Template:
+        """Return the compiled report template, parsing it only on first use."""
+        if BenchmarkReport._template is None:
+            BenchmarkReport._template = self.jinja_env.get_template('report.html')
+        return BenchmarkReport._template
+    
+    def render_html(self) -> str:
+        """
+        Render the HTML report in memory without writing a file.
+        
+        Returns:
+            The complete HTML document
+        """
+        return self._get_template().render(**self._prepare_template_data())
+    
     def generate_html(self, filename: str = "benchmark_report.html") -> str:
         """
         Generate an HTML report from benchmark results.
@@ -730,14 +732,11 @@ class BenchmarkReport:
         # Prepare template data
         template_data = self._prepare_template_data()
         
-        # Render HTML template
-        template = self.jinja_env.get_template('report.html')
-        html_content = template.render(**template_data)
-        
-        # Save HTML to file
+        # Render the HTML template straight into the file, chunk by chunk; the lock keeps
+        # a PDF fallback in generate_all from writing the same file concurrently
         output_path = self.output_dir / filename
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with self._html_lock, open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+            self._get_template().stream(**template_data).dump(f)
         
         return str(output_path)
     
@@ -751,20 +750,19 @@ class BenchmarkReport:
         Returns:
             Path to the generated PDF file
         """
-        # First generate HTML
-        html_path = self.generate_html("temp_report.html")
+        # Render the HTML in memory; pdfkit pipes it to wkhtmltopdf on stdin
+        html_content = self.render_html()
         
-        # Convert HTML to PDF
+        # Convert HTML to PDF; pdfkit is imported here so a missing package
+        # falls back to HTML like a missing wkhtmltopdf binary does
         output_path = self.output_dir / filename
         try:
-            pdfkit.from_file(html_path, str(output_path))
+            import pdfkit
+            pdfkit.from_string(html_content, str(output_path))
         except Exception as e:
             print(f"Error generating PDF: {e}")
             print("Falling back to HTML report only.")
-            return html_path
-        
-        # Remove temporary HTML file
-        os.remove(html_path)
+            return self.generate_html()
         
         return str(output_path)
     
@@ -778,70 +776,103 @@ class BenchmarkReport:
         Returns:
             Path to the generated Markdown file
         """
-        # Prepare template data
-        data = self._prepare_template_data()
+        # Prepare template data; the Markdown report has no charts
+        data = self._prepare_template_data(include_charts=False)
         
         # Create markdown content
-        md_content = f"# {data['title']}\n\n"
-        md_content += f"Generated on: {data['timestamp']}  \n"
-        md_content += f"Models evaluated: {', '.join(data['models'])}  \n"
-        md_content += f"Scenarios tested: {', '.join(data['scenarios'])}  \n\n"
+        parts = [f"# {data['title']}\n\n"]
+        parts.append(f"Generated on: {data['timestamp']}  \n")
+        parts.append(f"Models evaluated: {', '.join(data['models'])}  \n")
+        parts.append(f"Scenarios tested: {', '.join(data['scenarios'])}  \n\n")
         
-        md_content += "## Executive Summary\n\n"
-        md_content += f"{data['summary']}\n\n"
+        parts.append("## Executive Summary\n\n")
+        parts.append(f"{data['summary']}\n\n")
         
         if data['top_model']:
-            md_content += f"Top performing model: **{data['top_model']}** with an overall score of **{data['top_model_score']}/10**\n\n"
+            parts.append(f"Top performing model: **{data['top_model']}** with an overall score of **{data['top_model_score']}/10**\n\n")
         
         if data['key_findings']:
-            md_content += "### Key Findings\n\n"
-            for finding in data['key_findings']:
-                md_content += f"- {finding}\n"
-            md_content += "\n"
-        
-        md_content += "## Overall Performance Comparison\n\n"
-        
-        md_content += "### Model Performance Breakdown\n\n"
-        md_content += "| Model | Overall Score | " + " | ".join([cat.replace('_', ' ').title() for cat in data['scores'][data['models'][0]]['categories'].keys()]) + " |\n"
-        md_content += "| --- | --- | " + " | ".join(["---" for _ in data['scores'][data['models'][0]]['categories']]) + " |\n"
-        
-        for model in data['models']:
-            row = f"| {model} | {data['scores'][model]['overall']:.1f} | "
-            row += " | ".join([f"{score:.1f}" for score in data['scores'][model]['categories'].values()])
-            row += " |\n"
-            md_content += row
-        
-        md_content += "\n## Performance by Scenario\n\n"
-        md_content += "| Scenario | " + " | ".join(data['models']) + " |\n"
-        md_content += "| --- | " + " | ".join(["---" for _ in data['models']]) + " |\n"
-        
-        for scenario in data['scenarios']:
-            row = f"| {scenario.replace('_', ' ').title()} | "
-            row += " | ".join([f"{data['scenario_scores'][model].get(scenario, 0):.1f}" for model in data['models']])
-            row += " |\n"
-            md_content += row
-        
-        md_content += "\n## Tool Usage Analysis\n\n"
-        md_content += "### Key Observations\n\n"
-        for observation in data['tool_observations']:
-            md_content += f"- {observation}\n"
-        md_content += "\n"
-        
-        md_content += "## Recommendations\n\n"
-        for recommendation in data['recommendations']:
-            md_content += f"- {recommendation}\n"
-        md_content += "\n"
-        
-        md_content += "---\n\n"
-        md_content += f"Generated with bizCon Benchmark Framework | © {data['current_year']} - All rights reserved"
-        
-        # Save markdown to file
+            parts.append("### Key Findings\n\n")
+            parts.extend(f"- {finding}\n" for finding in data['key_findings'])
+            parts.append("\n")
+        
+        parts.append("## Overall Performance Comparison\n\n")
+        
+        parts.append("### Model Performance Breakdown\n\n")
+        # The table columns follow the first model's categories
+        categories = list(data['scores'][data['models'][0]]['categories'])
+        parts.append(f"| Model | Overall Score | {' | '.join(map(_pretty, categories))} |\n")
+        parts.append(f"| --- | --- | {' | '.join(['---'] * len(categories))} |\n")
+        
+        # Format the whole models x categories table at once, in the header's
+        # column order; a category the model lacks scores 0
+        category_cells = np.char.mod('%.1f', data['category_matrix'].reindex(columns=categories).fillna(0).to_numpy())
+        for model, cells in zip(data['models'], category_cells):
+            parts.append(f"| {model} | {data['scores'][model]['overall']:.1f} | {' | '.join(cells)} |\n")
+        
+        parts.append("\n## Performance by Scenario\n\n")
+        parts.append(f"| Scenario | {' | '.join(data['models'])} |\n")
+        parts.append(f"| --- | {' | '.join(['---'] * len(data['models']))} |\n")
+        
+        # Format the scenarios x models table at once; a scenario a model never ran scores 0
+        score_cells = np.char.mod('%.1f', data['scenario_matrix'].fillna(0).to_numpy().T)
+        for scenario, cells in zip(data['scenarios'], score_cells):
+            parts.append(f"| {_pretty(scenario)} | {' | '.join(cells)} |\n")
+        
+        parts.append("\n## Tool Usage Analysis\n\n")
+        parts.append("### Key Observations\n\n")
+        parts.extend(f"- {observation}\n" for observation in data['tool_observations'])
+        parts.append("\n")
+        
+        parts.append("## Recommendations\n\n")
+        parts.extend(f"- {recommendation}\n" for recommendation in data['recommendations'])
+        parts.append("\n")
+        
+        parts.append("---\n\n")
+        parts.append(f"Generated with bizCon Benchmark Framework | © {data['current_year']} - All rights reserved")
+        
+        # Save markdown to file, encoded once and written in a single binary write
         output_path = self.output_dir / filename
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        output_path.write_bytes(''.join(parts).encode('utf-8'))
         
         return str(output_path)
 
+    
+    def generate_all(self, formats: Tuple[str, ...] = ('html', 'pdf', 'markdown')) -> Dict[str, str]:
+        """
+        Generate several report formats concurrently.
+        
+        The template data and charts are computed once up front and shared by
+        every format, so only the rendering and PDF conversion overlap.
+        
+        Args:
+            formats: Report formats to generate ('html', 'pdf' and/or 'markdown')
+            
+        Returns:
+            Dictionary mapping each format to the path of its generated file
+            
+        Raises:
+            ValueError: If a format is not one of 'html', 'pdf' or 'markdown'
+        """
+        generators = {
+            'html': self.generate_html,
+            'pdf': self.generate_pdf,
+            'markdown': self.generate_markdown
+        }
+        unknown = [fmt for fmt in formats if fmt not in generators]
+        if unknown:
+            raise ValueError(f"Unknown report format(s): {', '.join(unknown)}; expected one of {', '.join(generators)}")
+        if not formats:
+            return {}
+        
+        # Warm the cached properties here so the workers never compute them twice
+        self._template_data
+        if 'html' in formats or 'pdf' in formats:
+            self.charts
+        
+        with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+            futures = {fmt: executor.submit(generators[fmt]) for fmt in formats}
+            return {fmt: future.result() for fmt, future in futures.items()}
 
 def generate_report(results_file: str, output_dir: str = None, format: str = 'html') -> str: #type: ignore
     """
@@ -855,9 +886,10 @@ def generate_report(results_file: str, output_dir: str = None, format: str = 'ht
     Returns:
         Path to the generated report file
     """
-    # Load results from file
-    with open(results_file, 'r', encoding='utf-8') as f:
-        results = json.load(f)
+    # Load results from file in one read
+    with open(results_file, 'rb') as f:
+        raw = f.read()
+    results = orjson.loads(raw) if orjson is not None else json.loads(raw)
     
     # Create report generator
     report = BenchmarkReport(results, output_dir)